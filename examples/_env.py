@@ -0,0 +1,12 @@
+"""Shared .env loading for the example agents."""
+
+import functools
+
+from dotenv import load_dotenv
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_env_loaded() -> bool:
+    """Load ``.env`` once per process, no matter how many agents import this."""
+    load_dotenv()
+    return True
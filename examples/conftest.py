@@ -0,0 +1,42 @@
+"""
+Pytest configuration for the example agent tests.
+"""
+
+EXAMPLE_FEATURES = {
+    "Weather Agent": [
+        "Basic weather queries",
+        "Multi-turn conversations",
+        "State preservation",
+        "Error handling",
+        "Timeout handling",
+    ],
+    "Smart Home Agent": [
+        "Light control",
+        "Temperature control",
+        "Multi-turn conversations",
+        "Enum types in arguments",
+        "Complex type annotations",
+    ],
+    "Customer Support Agent": [
+        "Order status checking",
+        "Return initiation",
+        "Multi-turn conversations",
+        "Context-aware responses",
+    ],
+}
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print the example feature summary once per run (verbose mode only)."""
+    if config.getoption("verbose") <= 0:
+        return
+
+    terminalreporter.write_line("\n" + "=" * 80)
+    terminalreporter.write_line("🎉 Agent Test Summary")
+    terminalreporter.write_line("=" * 80)
+    for agent_name, features in EXAMPLE_FEATURES.items():
+        terminalreporter.write_line(f"\n✅ {agent_name}:")
+        for feature in features:
+            terminalreporter.write_line(f"   • {feature}")
+    terminalreporter.write_line("\n💡 Agents work with ZERO code changes!")
+    terminalreporter.write_line("=" * 80)
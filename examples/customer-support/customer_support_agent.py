@@ -9,10 +9,9 @@ This demonstrates:
 🎯 ZERO CODE CHANGES from original LiveKit agent!
 """
 
+import json
 import logging
-from typing import Optional
-
-from dotenv import load_dotenv
+from typing import Any, Optional
 
 from livekit.agents import Agent, AgentSession, JobContext, RunContext, WorkerOptions, cli
 from livekit.agents.llm import function_tool
@@ -24,7 +23,42 @@ from livetxt import cli as livetxt_cli
 logger = logging.getLogger("customer-support-agent")
 logger.setLevel(logging.INFO)
 
-load_dotenv()
+try:
+    from examples._env import ensure_env_loaded
+except ImportError:  # run standalone, outside the repo root
+    from dotenv import load_dotenv as ensure_env_loaded
+
+ensure_env_loaded()
+
+
+def _toon_scalar(value: Any) -> str:
+    """Render a scalar TOON-style, quoting strings that would be ambiguous."""
+    if isinstance(value, str):
+        needs_quotes = not value or value != value.strip() or any(c in value for c in ',:"\n')
+        return json.dumps(value) if needs_quotes else value
+    return json.dumps(value)
+
+
+def encode_tool_result(result: Any) -> str:
+    """
+    Encode a tool result in a compact TOON-style (Token-Oriented Object Notation) form.
+
+    Flat objects become ``key: value`` lines and lists of scalars become
+    ``key[N]: a,b`` rows, which costs the LLM far fewer tokens than JSON syntax.
+    Nested or irregular structures fall back to compact JSON.
+    """
+    if not isinstance(result, dict):
+        return result if isinstance(result, str) else json.dumps(result, separators=(",", ":"))
+
+    lines = []
+    for key, value in result.items():
+        if isinstance(value, list) and not any(isinstance(v, (dict, list)) for v in value):
+            lines.append(f"{key}[{len(value)}]: " + ",".join(_toon_scalar(v) for v in value))
+        elif isinstance(value, (dict, list)):
+            return json.dumps(result, separators=(",", ":"))
+        else:
+            lines.append(f"{key}: {_toon_scalar(value)}")
+    return "\n".join(lines)
 
 
 class CustomerSupportAgent(Agent):
@@ -38,21 +72,26 @@ class CustomerSupportAgent(Agent):
                 "Be professional, empathetic, and solution-oriented. "
                 "Always confirm the user's information before taking actions."
             ),
-            llm=openai.LLM(model="gpt-4.1-mini"),
+            # Let the model emit several tool calls in one turn (e.g. check an order's
+            # status and start its return); livekit-agents already executes them concurrently.
+            # Responses API LLM, as in the smart-home example.
+            llm=openai.responses.LLM(model="gpt-4.1-mini", parallel_tool_calls=True),
         )
         self.customer_email: Optional[str] = None
         self.order_number: Optional[str] = None
     
     @function_tool
-    async def check_order_status(self, order_number: str, email: str) -> dict:
+    async def check_order_status(self, order_number: str, email: str) -> str:
         """
         Check the status of a customer's order.
+
+        The order details are returned as "key: value" lines (lists as "key[N]: a,b").
         
         Args:
             order_number: The order number (e.g., "ORD-12345")
             email: Customer's email address for verification
         """
-        logger.info(f"Checking order {order_number} for {email}")
+        logger.info("Checking order %s for %s", order_number, email)
         
         # Mock order data
         order_data = {
@@ -67,7 +106,7 @@ class CustomerSupportAgent(Agent):
         self.customer_email = email
         self.order_number = order_number
         
-        return order_data
+        return encode_tool_result(order_data)
     
     @function_tool
     async def initiate_return(self, order_number: str, reason: str) -> str:
@@ -78,7 +117,7 @@ class CustomerSupportAgent(Agent):
             order_number: The order number to return
             reason: Reason for the return
         """
-        logger.info(f"Initiating return for {order_number}: {reason}")
+        logger.info("Initiating return for %s: %s", order_number, reason)
         
         return (
             f"I've started a return for order {order_number}. "
@@ -95,7 +134,7 @@ class CustomerSupportAgent(Agent):
             order_number: The order number
             new_address: The new shipping address
         """
-        logger.info(f"Updating address for {order_number} to {new_address}")
+        logger.info("Updating address for %s to %s", order_number, new_address)
         
         return (
             f"I've updated the shipping address for order {order_number} to: {new_address}. "
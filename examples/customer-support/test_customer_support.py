@@ -87,21 +87,3 @@ async def test_customer_support_multiturn():
 
     assert result2.status == "success"
     print(f"✅ Turn 2: {result2.response_text}")
-
-
-@pytest.mark.anyio
-async def test_customer_support_summary():
-    """Print summary of customer support agent tests."""
-    print("\n" + "=" * 80)
-    print("🎉 Customer Support Agent Test Summary")
-    print("=" * 80)
-    print()
-    print("✅ Features Tested:")
-    print("   • Order status checking")
-    print("   • Return initiation")
-    print("   • Multi-turn conversations")
-    print("   • Context-aware responses")
-    print()
-    print("💡 Demonstrates business logic integration!")
-    print("=" * 80)
-
@@ -14,8 +14,6 @@ import logging
 from enum import Enum
 from typing import Literal
 
-from dotenv import load_dotenv
-
 from livekit.agents import Agent, AgentSession, JobContext, WorkerOptions, cli
 from livekit.agents.llm import function_tool
 from livekit.plugins import openai
@@ -26,7 +24,12 @@ from livetxt import cli as livetxt_cli
 logger = logging.getLogger("smart-home-agent")
 logger.setLevel(logging.INFO)
 
-load_dotenv()
+try:
+    from examples._env import ensure_env_loaded
+except ImportError:  # run standalone, outside the repo root
+    from dotenv import load_dotenv as ensure_env_loaded
+
+ensure_env_loaded()
 
 
 class RoomName(str, Enum):
@@ -48,7 +51,11 @@ class SmartHomeAgent(Agent):
                 "You can control lights and check the weather. "
                 "Be helpful and confirm actions clearly."
             ),
-            llm=openai.LLM(model="gpt-4.1-mini"),
+            # Let the model emit several tool calls in one turn (e.g. "turn on the kitchen
+            # and bedroom lights"); livekit-agents already executes them concurrently.
+            # The Responses API LLM chains requests with previous_response_id, so follow-up
+            # calls only send the newly appended items instead of the whole history.
+            llm=openai.responses.LLM(model="gpt-4.1-mini", parallel_tool_calls=True),
         )
     
     @function_tool
@@ -60,7 +67,7 @@ class SmartHomeAgent(Agent):
             room: The room to control the light in
             switch_to: Whether to turn the light "on" or "off"
         """
-        logger.info(f"Toggling light in {room} to {switch_to}")
+        logger.info("Toggling light in %s to %s", room, switch_to)
         return f"The light in the {room.value} is now {switch_to}."
     
     @function_tool
@@ -71,7 +78,7 @@ class SmartHomeAgent(Agent):
         Args:
             location: The location to get weather for (e.g., "San Francisco")
         """
-        logger.info(f"Getting weather for {location}")
+        logger.info("Getting weather for %s", location)
         # Mock response
         return f"The weather in {location} is sunny and 72°F."
     
@@ -84,7 +91,7 @@ class SmartHomeAgent(Agent):
             room: The room to set temperature for
             temperature: Target temperature in Fahrenheit
         """
-        logger.info(f"Setting {room} temperature to {temperature}°F")
+        logger.info("Setting %s temperature to %s°F", room, temperature)
         return f"Set the {room.value} temperature to {temperature}°F."
 
 
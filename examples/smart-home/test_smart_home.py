@@ -87,22 +87,3 @@ async def test_smart_home_multiturn():
 
     assert result2.status == "success"
     print(f"✅ Turn 2: {result2.response_text}")
-
-
-@pytest.mark.anyio
-async def test_smart_home_summary():
-    """Print summary of smart home agent tests."""
-    print("\n" + "=" * 80)
-    print("🎉 Smart Home Agent Test Summary")
-    print("=" * 80)
-    print()
-    print("✅ Features Tested:")
-    print("   • Light control")
-    print("   • Temperature control")
-    print("   • Multi-turn conversations")
-    print("   • Enum types in arguments")
-    print("   • Complex type annotations")
-    print()
-    print("💡 Demonstrates advanced type handling!")
-    print("=" * 80)
-
@@ -150,22 +150,3 @@ async def test_weather_timeout_handling():
     # Should timeout or succeed
     assert result.status in ["success", "timeout", "error"]
     print(f"\n✅ Timeout Test: {result.status}")
-
-
-@pytest.mark.anyio
-async def test_weather_summary():
-    """Print summary of weather agent tests."""
-    print("\n" + "=" * 80)
-    print("🎉 Weather Agent Test Summary")
-    print("=" * 80)
-    print()
-    print("✅ Features Tested:")
-    print("   • Basic weather queries")
-    print("   • Multi-turn conversations")
-    print("   • State preservation")
-    print("   • Error handling")
-    print("   • Timeout handling")
-    print()
-    print("💡 Agent works with ZERO code changes!")
-    print("=" * 80)
-
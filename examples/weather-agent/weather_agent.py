@@ -9,10 +9,12 @@ This is a REAL LiveKit voice agent that uses:
 🎯 from original LiveKit agent!
    Just change how you run it (see test_livekit_agent_weather.py)
 """
+from __future__ import annotations
+
+import json
 import logging
 
 import aiohttp
-from dotenv import load_dotenv
 
 from livekit.agents import JobContext, WorkerOptions, cli
 from livekit.agents.llm import function_tool
@@ -26,14 +28,24 @@ from livetxt import cli as livetxt_cli
 logger = logging.getLogger("weather-example")
 logger.setLevel(logging.INFO)
 
-load_dotenv()
+try:
+    from examples._env import ensure_env_loaded
+except ImportError:  # run standalone, outside the repo root
+    from dotenv import load_dotenv as ensure_env_loaded
+
+ensure_env_loaded()
 
 
 class WeatherAgent(Agent):
-    def __init__(self) -> None:
+    def __init__(self, http_session: aiohttp.ClientSession | None = None) -> None:
+        # Reused by every tool call of this job, so repeated lookups share
+        # keep-alive connections and cached DNS; None opens one per call
+        self._http_session = http_session
         super().__init__(
             instructions="You are a weather agent.",
-            llm=openai.LLM(model="gpt-4.1-mini"),
+            # Route every turn through the same prompt-cache shard so the static
+            # instructions + tool schema prefix is served from OpenAI's prefix cache.
+            llm=openai.LLM(model="gpt-4.1-mini", prompt_cache_key="livetxt-weather-agent"),
         )
 
     @function_tool
@@ -41,7 +53,7 @@ class WeatherAgent(Agent):
         self,
         latitude: str,
         longitude: str,
-    ):
+    ) -> str:
         """Called when the user asks about the weather. This function will return the weather for
         the given location. When given a location, please estimate the latitude and longitude of the
         location and do not ask the user for them.
@@ -51,22 +63,30 @@ class WeatherAgent(Agent):
             longitude: The longitude of the location
         """
 
-        logger.info(f"getting weather for {latitude}, {longitude}")
+        logger.info("getting weather for %s, %s", latitude, longitude)
         url = f"https://api.open-meteo.com/v1/forecast?latitude={latitude}&longitude={longitude}&current=temperature_2m"
-        weather_data = {}
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    # response from the function call is returned to the LLM
-                    weather_data = {
-                        "temperature": data["current"]["temperature_2m"],
-                        "temperature_unit": "Celsius",
-                    }
-                else:
-                    raise Exception(f"Failed to get weather data, status code: {response.status}")
-
-        return weather_data
+        if self._http_session is not None:
+            weather_data = await _fetch_weather(self._http_session, url)
+        else:
+            async with aiohttp.ClientSession() as session:
+                weather_data = await _fetch_weather(session, url)
+
+        # livekit stringifies tool output with str(), which yields a Python repr for
+        # dicts; hand the LLM compact JSON instead.
+        return json.dumps(weather_data, separators=(",", ":"))
+
+
+async def _fetch_weather(session: aiohttp.ClientSession, url: str) -> dict:
+    """Fetch the current temperature from open-meteo."""
+    async with session.get(url) as response:
+        if response.status == 200:
+            data = await response.json()
+            # response from the function call is returned to the LLM
+            return {
+                "temperature": data["current"]["temperature_2m"],
+                "temperature_unit": "Celsius",
+            }
+        raise Exception(f"Failed to get weather data, status code: {response.status}")
 
 
 async def entrypoint(ctx: JobContext):
@@ -76,10 +96,16 @@ async def entrypoint(ctx: JobContext):
         "user_id": "your user_id",
     }
 
+    # One HTTP session per job, closed when this job ends
+    http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=20, ttl_dns_cache=300)
+    )
+    ctx.add_shutdown_callback(http_session.close)
+
     session = AgentSession()
 
     await session.start(
-        agent=WeatherAgent(),
+        agent=WeatherAgent(http_session),
         room=ctx.room,
         room_input_options=RoomInputOptions(),
         room_output_options=RoomOutputOptions(transcription_enabled=True),
@@ -5,6 +5,8 @@ This is a standard livekit-agents Agent with ZERO livetxt-specific code.
 It works exactly as written - just run with: livetxt run my_agent.py
 """
 
+import json
+
 from livekit.agents import Agent, llm, WorkerOptions
 from livetxt.cli import cli as livetxt_cli
 
@@ -18,7 +20,7 @@ class WeatherAssistant(Agent):
         )
     
     @llm.function_tool()
-    async def get_weather(self, location: str) -> dict:
+    async def get_weather(self, location: str) -> str:
         """
         Get current weather for a location.
         
@@ -26,19 +28,19 @@ class WeatherAssistant(Agent):
             location: City name or location
             
         Returns:
-            Weather information
+            Weather information as compact JSON
         """
         # In a real agent, this would call a weather API
         # For demo, return mock data
-        return {
+        return json.dumps({
             "location": location,
             "temperature": 72,
             "condition": "Sunny",
             "humidity": 45
-        }
+        }, separators=(",", ":"))
     
     @llm.function_tool()
-    async def get_forecast(self, location: str, days: int = 3) -> list:
+    async def get_forecast(self, location: str, days: int = 3) -> str:
         """
         Get weather forecast for a location.
         
@@ -47,14 +49,14 @@ class WeatherAssistant(Agent):
             days: Number of days (1-7)
             
         Returns:
-            List of forecast data
+            List of forecast data as compact JSON
         """
         # Mock forecast data
-        return [
+        return json.dumps([
             {"day": 1, "temp": 72, "condition": "Sunny"},
             {"day": 2, "temp": 68, "condition": "Cloudy"},
             {"day": 3, "temp": 65, "condition": "Rainy"}
-        ][:days]
+        ][:days], separators=(",", ":"))
 
 def entrypoint():
     return WeatherAssistant()
@@ -2,27 +2,49 @@
 LiveTxt - Run LiveKit agents in text-only mode.
 """
 
-from .models import JobRequest, JobResult, SerializableSessionState
-from .serialization import (
-    deserialize_chat_context,
-    deserialize_session_state,
-    serialize_chat_context,
-    serialize_session_state,
-)
-from .session_wrapper import LiveTxtSessionWrapper, SessionContext
-from .worker import execute_job
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .models import JobRequest, JobResult, SerializableSessionState
+    from .serialization import (
+        deserialize_chat_context,
+        deserialize_session_state,
+        serialize_chat_context,
+        serialize_session_state,
+        trim_chat_context,
+    )
+    from .session_wrapper import LiveTxtSessionWrapper, SessionContext
+    from .worker import execute_job
 
 __version__ = "0.0.1"
 
-__all__ = [
-    "JobRequest",
-    "JobResult",
-    "SerializableSessionState",
-    "execute_job",
-    "LiveTxtSessionWrapper",
-    "SessionContext",
-    "serialize_chat_context",
-    "deserialize_chat_context",
-    "serialize_session_state",
-    "deserialize_session_state",
-]
+# Public names are resolved on first access so that importing a light submodule
+# (e.g. `livetxt.cli` for `livetxt --help`) does not pull in livekit-agents.
+_LAZY_ATTRS = {
+    "JobRequest": ".models",
+    "JobResult": ".models",
+    "SerializableSessionState": ".models",
+    "execute_job": ".worker",
+    "LiveTxtSessionWrapper": ".session_wrapper",
+    "SessionContext": ".session_wrapper",
+    "serialize_chat_context": ".serialization",
+    "deserialize_chat_context": ".serialization",
+    "serialize_session_state": ".serialization",
+    "deserialize_session_state": ".serialization",
+    "trim_chat_context": ".serialization",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import importlib.util
 import logging
 import sys
@@ -11,12 +12,13 @@ from typing import TYPE_CHECKING
 
 import click
 
-from .config import LiveTxtConfig
-from .runtime import run_worker
-
+# Heavy imports (livekit, pydantic, websockets, fastapi/uvicorn) are deferred to
+# the commands that need them so `livetxt --help` / `livetxt version` stay fast.
 if TYPE_CHECKING:
     from livekit.agents import WorkerOptions
 
+    from .config import LiveTxtConfig
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -53,6 +55,9 @@ def run_app(opts: WorkerOptions) -> None:
     Args:
         opts: WorkerOptions containing the entrypoint function and configuration
     """
+    from .config import LiveTxtConfig
+    from .runtime import run_worker
+
     # Extract entrypoint function
     entrypoint = opts.entrypoint_fnc
 
@@ -87,13 +92,22 @@ def load_agent_entrypoint(agent_file: str):
     """
     Load agent entrypoint function from a Python file.
 
-    Looks for a function named 'entrypoint' in the file.
+    Looks for a function named 'entrypoint' in the file. The result is cached
+    until the file's mtime changes.
     """
-    agent_path = Path(agent_file)
+    agent_path = Path(agent_file).resolve()
 
     if not agent_path.exists():
         raise FileNotFoundError(f"Agent file not found: {agent_file}")
 
+    return _load_entrypoint_cached(agent_path, agent_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_entrypoint_cached(agent_path: Path, mtime_ns: int):
+    """Uncached body of load_agent_entrypoint; mtime_ns is only part of the key."""
+    agent_file = str(agent_path)
+
     # Load the module
     spec = importlib.util.spec_from_file_location("agent_module", agent_path)
     if not spec or not spec.loader:
@@ -119,6 +133,7 @@ async def run_worker_with_agent_class(config: LiveTxtConfig, agent_class: type):
     2. Automatically captures and restores state
     3. Returns state to gateway
     """
+    from .runtime import run_worker
     from .shim.auto_patch import (
         clear_agent_state,
         get_agent_state,
@@ -237,6 +252,8 @@ def run(agent_file: str, gateway_url: str, api_key: str, agent_class: str | None
         sys.exit(1)
 
     # STEP 3: Create config
+    from .config import LiveTxtConfig
+
     config = LiveTxtConfig(gateway_url=gateway_url, api_key=api_key)
     click.echo(f"🌐 Connecting to {gateway_url}")
     click.echo("📱 State capture enabled automatically")
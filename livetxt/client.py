@@ -1,17 +1,19 @@
 """WebSocket client for connecting to LiveTxt Gateway."""
 
+from __future__ import annotations
+
 import asyncio
 import contextlib
-import json
 import logging
 import time
 from collections.abc import Awaitable, Callable
 from typing import Any
-from urllib.parse import urlencode, urlparse, urlunparse
 
 import websockets
 from websockets.asyncio.client import ClientConnection
 
+from ._json import dumps as _dumps
+from ._json import loads as _loads
 from .config import LiveTxtConfig
 
 logger = logging.getLogger(__name__)
@@ -19,6 +21,18 @@ logger = logging.getLogger(__name__)
 
 MessageHandler = Callable[[dict[str, Any]], Awaitable[None]]
 
+# Heartbeats are the only periodic outbound frame; format them from a template
+# instead of building a dict and running the JSON encoder each time.
+_HEARTBEAT_PREFIX = '{"event":"heartbeat","timestamp":'
+
+
+async def _cancel_task(task: asyncio.Task | None) -> None:
+    """Cancel a background task and wait for it to finish."""
+    if task:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
 
 class LiveTxtClient:
     """WebSocket client that connects to LiveTxt Gateway."""
@@ -29,7 +43,9 @@ class LiveTxtClient:
         self.worker_id: str | None = None
         self._message_handler: MessageHandler | None = None
         self._running = False
+        self._closed: asyncio.Event | None = None
         self._heartbeat_task: asyncio.Task | None = None
+        self._message_task: asyncio.Task | None = None
 
     def on_message(self, handler: MessageHandler) -> None:
         """Register a message handler."""
@@ -37,27 +53,23 @@ class LiveTxtClient:
 
     async def connect(self) -> None:
         """Connect to the gateway."""
-        # Build WebSocket URL with API key
-        parsed = urlparse(self.config.gateway_url)
-        scheme = "wss" if parsed.scheme == "https" else "ws"
-
-        # Add /worker/connect endpoint and API key
-        query = urlencode({"api_key": self.config.api_key})
-        ws_url = urlunparse((scheme, parsed.netloc, "/worker/connect", "", query, ""))
+        # WebSocket URL (with API key) is computed once per config
+        ws_url = self.config.ws_url
 
-        logger.info(f"Connecting to {parsed.scheme}://{parsed.netloc}...")
+        logger.info("Connecting to %s...", ws_url.split("?", 1)[0])  # without the API key
 
         try:
             self.ws = await websockets.connect(ws_url)
             self._running = True
+            self._closed = asyncio.Event()
 
             # Wait for welcome message
             welcome = await self.ws.recv()
-            data = json.loads(welcome)
+            data = _loads(welcome)
 
             if data.get("event") == "connected":
                 self.worker_id = data.get("worker_id")
-                logger.info(f"✅ Connected as worker {self.worker_id}")
+                logger.info("✅ Connected as worker %s", self.worker_id)
 
                 # Send ready signal
                 await self.send_event("ready", {"worker_id": self.worker_id})
@@ -65,87 +77,128 @@ class LiveTxtClient:
                 # Start heartbeat
                 self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
-                # Start message loop
-                asyncio.create_task(self._message_loop())
+                # Start message loop (keep a reference so it is not GC'd mid-flight)
+                self._message_task = asyncio.create_task(self._message_loop())
 
         except Exception as e:
-            logger.error(f"Failed to connect: {e}")
+            logger.error("Failed to connect: %s", e)
             raise
 
     async def disconnect(self) -> None:
-        """Disconnect from the gateway."""
-        self._running = False
+        """Disconnect from the gateway.
 
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._heartbeat_task
+        Background tasks are cancelled and the socket is closed concurrently, so
+        a slow close handshake does not add to the task teardown time.
+        """
+        self._mark_closed()
 
+        message_task = self._message_task
+        if message_task is asyncio.current_task():
+            message_task = None
+        self._message_task = None
+
+        await asyncio.gather(
+            _cancel_task(self._heartbeat_task),
+            _cancel_task(message_task),
+            self._close_ws(),
+        )
+
+    async def _close_ws(self) -> None:
         if self.ws:
             await self.ws.close()
             logger.info("Disconnected from gateway")
 
     async def send_event(self, event: str, data: dict[str, Any]) -> None:
-        """Send an event to the gateway."""
-        if not self.ws:
-            raise RuntimeError("Not connected")
+        """Send an event to the gateway.
 
-        message = {"event": event, **data}
-        await self.ws.send(json.dumps(message))
+        The event name is added to ``data`` in place rather than copying it, so
+        callers must pass a fresh dict and not reuse it afterwards.
+        """
+        data["event"] = event
+        await self._send(data)
 
     async def send_response(self, session_id: str, message: str) -> None:
         """Send a response for a session."""
-        await self.send_event("response", {"session_id": session_id, "message": message})
+        await self._send({"event": "response", "session_id": session_id, "message": message})
+
+    async def _send(self, message: dict[str, Any]) -> None:
+        """Encode and send a complete message."""
+        if not self.ws:
+            raise RuntimeError("Not connected")
+
+        await self.ws.send(_dumps(message))
 
     async def _message_loop(self) -> None:
         """Listen for messages from the gateway."""
-        if not self.ws:
+        ws = self.ws
+        if not ws:
             return
 
         try:
-            async for message in self.ws:
-                if isinstance(message, bytes):
-                    message = message.decode("utf-8")
-
+            async for message in ws:
                 try:
-                    data = json.loads(message)
-                    event = data.get("event")
-
-                    if event == "message":
-                        # Incoming message from SMS
-                        if self._message_handler:
-                            await self._message_handler(data)
-
-                    elif event == "heartbeat_ack":
-                        # Heartbeat acknowledged
-                        pass
-
-                    else:
-                        logger.warning(f"Unknown event: {event}")
-
-                except json.JSONDecodeError:
-                    logger.error(f"Invalid JSON: {message}")
+                    data = _loads(message)
+                except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
+                    logger.error("Invalid JSON: %r", message)
+                    continue
+
+                event = data.get("event")
+
+                if event == "message":
+                    # Incoming message from SMS. The handler is looked up per
+                    # message: LiveTxtWorker registers it after connect() has
+                    # already started this loop.
+                    handler = self._message_handler
+                    if handler:
+                        try:
+                            await handler(data)
+                        except Exception:
+                            logger.exception("Error handling message")
+
+                elif event == "heartbeat_ack":
+                    # Heartbeat acknowledged
+                    pass
+
+                else:
+                    logger.warning("Unknown event: %s", event)
+
+            # Iteration ends without raising on a clean close
+            logger.info("Connection closed by gateway")
+            self._mark_closed()
 
         except websockets.exceptions.ConnectionClosed:
             logger.warning("Connection closed by gateway")
-            self._running = False
+            self._mark_closed()
 
         except Exception as e:
-            logger.error(f"Error in message loop: {e}")
-            self._running = False
+            logger.error("Error in message loop: %s", e)
+            self._mark_closed()
 
     async def _heartbeat_loop(self) -> None:
         """Send periodic heartbeats to the gateway."""
+        interval = self.config.heartbeat_interval
+
         while self._running:
             try:
-                await asyncio.sleep(self.config.heartbeat_interval)
-                if self._running and self.ws:
-                    await self.send_event("heartbeat", {"timestamp": time.time()})
+                await asyncio.sleep(interval)
+                ws = self.ws
+                if self._running and ws:
+                    await ws.send(f"{_HEARTBEAT_PREFIX}{time.time()!r}}}")
 
             except Exception as e:
-                logger.error(f"Error sending heartbeat: {e}")
+                logger.error("Error sending heartbeat: %s", e)
                 break
 
+    def _mark_closed(self) -> None:
+        self._running = False
+        if self._closed:
+            self._closed.set()
+
+    async def wait_closed(self) -> None:
+        """Wait until the connection is closed by either side."""
+        if self._closed and self._running:
+            await self._closed.wait()
+
     def is_connected(self) -> bool:
         """Check if connected to gateway."""
         return self._running and self.ws is not None
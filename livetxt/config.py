@@ -1,22 +1,43 @@
 """Configuration for LiveTxt runtime."""
 
+import functools
 import os
+from urllib.parse import urlencode, urlparse, urlunparse
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class LiveTxtConfig(BaseModel):
     """Configuration for LiveTxt runtime."""
 
+    # Frozen so the instance cached by from_env() can be shared safely.
+    model_config = ConfigDict(frozen=True)
+
     gateway_url: str
     api_key: str
     reconnect_attempts: int = 5
     reconnect_delay: float = 2.0
     heartbeat_interval: float = 30.0
+    max_sessions: int = 1000
+    max_concurrent_sessions: int = 100
+    session_ttl: float = 3600.0
+    send_debounce: float = 0.0
+
+    @functools.cached_property
+    def ws_url(self) -> str:
+        """WebSocket URL of the gateway's worker endpoint, including the API key."""
+        parsed = urlparse(self.gateway_url)
+        scheme = "wss" if parsed.scheme == "https" else "ws"
+        query = urlencode({"api_key": self.api_key})
+        return urlunparse((scheme, parsed.netloc, "/worker/connect", "", query, ""))
 
     @classmethod
     def from_env(cls) -> "LiveTxtConfig":
-        """Load configuration from environment variables."""
+        """Load configuration from environment variables.
+
+        The validated config is cached per (gateway URL, API key), so repeated
+        calls skip model construction but still pick up changed variables.
+        """
         gateway_url = os.getenv("LIVETXT_GATEWAY_URL")
         api_key = os.getenv("LIVETXT_API_KEY")
 
@@ -25,4 +46,9 @@ class LiveTxtConfig(BaseModel):
         if not api_key:
             raise ValueError("LIVETXT_API_KEY environment variable not set")
 
-        return cls(gateway_url=gateway_url, api_key=api_key)
+        return _config_from_env_values(cls, gateway_url, api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _config_from_env_values(cls: type[LiveTxtConfig], gateway_url: str, api_key: str) -> LiveTxtConfig:
+    return cls(gateway_url=gateway_url, api_key=api_key)
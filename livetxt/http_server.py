@@ -6,25 +6,44 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from . import _json
 from .loader import load_agent_from_file
 from .shim.auto_patch import (
+    clear_agent_state,
+    editable_chat_ctx,
     get_agent_state,
     install_agent_hooks,
     patch_livekit_auto,
+    restore_agent_state,
     set_execution_context,
 )
 
 logger = logging.getLogger(__name__)
 
+# Idle agent instances kept per user_id. Constructing an agent (and its LLM
+# client/connection pool) costs tens of ms, so repeat callers reuse theirs.
+# Only classes that set ``livetxt_poolable = True`` are pooled: a reused agent
+# keeps its instance attributes, and only chat_ctx and function calls are
+# restored from the request, so other agents must start fresh every turn.
+AGENT_POOL_SIZE = 128
+
+
+class _ExecuteError(Exception):
+    """Raised while handling an execute request; becomes an error response."""
+
 
 class AgentStateModel(BaseModel):
     chat_context: dict[str, Any] | None = None
-    function_calls: list[dict[str, Any]] = []
+    function_calls: list[dict[str, Any]] = Field(default_factory=list)
     user_state: str = "listening"
     agent_state: str = "idle"
 
@@ -56,13 +75,40 @@ class LoadAgentRequest(BaseModel):
 
 
 def create_app(agent_file: str | None = None, agent_class: str | None = None) -> FastAPI:
-    app = FastAPI(title="LiveTxt Worker", version="0.0.1")
-
     # Globals
-    state: dict[str, Any] = {"agent_class": None, "agent_file": None}
-
-    @app.on_event("startup")
-    async def on_startup() -> None:
+    state: dict[str, Any] = {
+        "agent_class": None,
+        "agent_file": None,
+        "has_chat_ctx": False,
+        "poolable": False,
+    }
+    agent_pool: OrderedDict[str, Any] = OrderedDict()
+
+    def _release_agent(user_id: str, agent: Any) -> None:
+        """Return an agent to the pool, evicting the least recently used one."""
+        if not state["poolable"]:
+            clear_agent_state(agent)
+            return
+        agent_pool[user_id] = agent
+        if len(agent_pool) > AGENT_POOL_SIZE:
+            _, evicted = agent_pool.popitem(last=False)
+            clear_agent_state(evicted)
+
+    def _set_agent_class(agent_cls: type, path: str) -> None:
+        """Install the loaded agent class and cache its class-level capabilities."""
+        state["agent_class"] = agent_cls
+        state["agent_file"] = path
+        state["has_chat_ctx"] = hasattr(agent_cls, "chat_ctx")
+        state["poolable"] = getattr(agent_cls, "livetxt_poolable", False) is True
+
+    def _clear_agent_pool() -> None:
+        while agent_pool:
+            _, agent = agent_pool.popitem()
+            clear_agent_state(agent)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        # Patch and load before the server accepts its first request
         patch_livekit_auto()
         logger.info("✅ LiveKit auto-patching applied")
 
@@ -70,70 +116,56 @@ def create_app(agent_file: str | None = None, agent_class: str | None = None) ->
         if agent_file:
             try:
                 agent_cls = load_agent_from_file(agent_file, agent_class)
-                state["agent_class"] = agent_cls
-                state["agent_file"] = agent_file
-                logger.info(f"✅ Auto-loaded agent: {agent_cls.__name__} from {agent_file}")
+                _set_agent_class(agent_cls, agent_file)
+                logger.info("✅ Auto-loaded agent: %s from %s", agent_cls.__name__, agent_file)
             except Exception as e:
-                logger.error(f"❌ Failed to auto-load agent: {e}")
+                logger.error("❌ Failed to auto-load agent: %s", e)
                 raise
 
+        yield
+
+        _clear_agent_pool()
+
+    app = FastAPI(title="LiveTxt Worker", version="0.0.1", lifespan=lifespan)
+
     @app.post("/load_agent")
     async def load_agent(agent_file: str, agent_class: str | None = None) -> dict[str, Any]:
         try:
             agent_cls = load_agent_from_file(agent_file, agent_class)
-            state["agent_class"] = agent_cls
-            state["agent_file"] = agent_file
-            logger.info(f"✅ Loaded agent: {agent_cls.__name__} from {agent_file}")
+            if agent_cls is not state["agent_class"]:
+                _clear_agent_pool()
+            _set_agent_class(agent_cls, agent_file)
+            logger.info("✅ Loaded agent: %s from %s", agent_cls.__name__, agent_file)
             return {"status": "loaded", "agent_class": agent_cls.__name__}
         except Exception as e:
-            logger.error(f"Failed to load agent: {e}")
+            logger.error("Failed to load agent: %s", e)
             raise HTTPException(status_code=400, detail=str(e)) from e
 
     @app.post("/execute", response_model=SimpleExecuteResponse)
-    async def execute(req: SimpleExecuteRequest) -> SimpleExecuteResponse:
-        start = time.time()
+    async def execute(req: SimpleExecuteRequest) -> Response:
+        # The response is already a validated model, so serialize it directly
+        # instead of letting FastAPI re-validate it against response_model.
+        resp = await _execute(req)
+        return Response(content=resp.model_dump_json(), media_type="application/json")
 
-        if state["agent_class"] is None:
-            return SimpleExecuteResponse(
-                request_id=req.request_id, status="error", error="Agent not loaded"
-            )
+    @app.post("/execute/stream")
+    async def execute_stream(req: SimpleExecuteRequest) -> StreamingResponse:
+        """Stream the reply as server-sent events while the LLM generates it.
 
-        try:
-            # Provide previous state to auto-patch layer
-            prev_state = req.agent_state.model_dump() if req.agent_state else None
-            set_execution_context({"previous_state": prev_state, "user_id": req.user_id})
-
-            # Create agent instance and install hooks
-            agent_cls = state["agent_class"]
-            agent = agent_cls()
-            install_agent_hooks(agent)
-        except Exception as e:
-            logger.error(f"Error creating agent: {e}", exc_info=True)
-            return SimpleExecuteResponse(
-                request_id=req.request_id,
-                status="error",
-                error=f"Agent creation failed: {str(e)}"
-            )
-
-        # Process message through agent's LLM
-        try:
+        Each text chunk is sent as a ``data:`` event holding a JSON string. The
+        final ``done`` event carries the same body ``/execute`` would return,
+        including the updated state.
+        """
+        return StreamingResponse(_stream_execute(req), media_type="text/event-stream")
 
-            if not hasattr(agent, "chat_ctx") or agent.chat_ctx is None:
-                logger.error("Agent does not have chat_ctx initialized")
-                return SimpleExecuteResponse(
-                    request_id=req.request_id,
-                    status="error",
-                    error="Agent chat_ctx not initialized"
-                )
+    async def _execute(req: SimpleExecuteRequest) -> SimpleExecuteResponse:
+        start_ns = time.perf_counter_ns()
 
-            # Copy chat context (it's read-only), add user message, then update agent
-            chat_ctx = agent.chat_ctx.copy()
-            chat_ctx.add_message(role="user", content=req.message)
-            await agent.update_chat_ctx(chat_ctx)
-            logger.debug(f"Added user message: {req.message[:50]}...")
+        try:
+            agent, chat_ctx, llm = await _begin_turn(req)
 
             # Run LLM to get response
-            if not hasattr(agent, "llm") or agent.llm is None:
+            if not llm:
                 # Fallback if no LLM configured
                 reply_text = f"Echo: {req.message}"
                 logger.warning("No LLM configured, using echo response")
@@ -141,51 +173,151 @@ def create_app(agent_file: str | None = None, agent_class: str | None = None) ->
                 # Run LLM chat completion
                 try:
                     # Call LLM with chat context
-                    response_stream = agent.llm.chat(chat_ctx=agent.chat_ctx)
+                    response_stream = llm.chat(chat_ctx=chat_ctx)
 
                     # Collect response using to_str_iterable() for simple text
-                    reply_text = ""
+                    chunks: list[str] = []
                     async for text_chunk in response_stream.to_str_iterable():
-                        reply_text += text_chunk
+                        chunks.append(text_chunk)
+                    reply_text = "".join(chunks)
 
-                    logger.info(f"LLM response: {reply_text[:100]}...")
+                    logger.info("LLM response: %.100s...", reply_text)
 
                 except Exception as llm_error:
-                    logger.error(f"LLM execution failed: {llm_error}", exc_info=True)
-                    return SimpleExecuteResponse(
-                        request_id=req.request_id,
-                        status="error",
-                        error=f"LLM execution failed: {str(llm_error)}"
-                    )
-
-            # Add assistant response to context using copy() and update_chat_ctx()
+                    logger.error("LLM execution failed: %s", llm_error, exc_info=True)
+                    raise _ExecuteError(f"LLM execution failed: {str(llm_error)}") from llm_error
+
+            return await _finish_turn(req, agent, chat_ctx, reply_text, start_ns)
+
+        except _ExecuteError as e:
+            return SimpleExecuteResponse(request_id=req.request_id, status="error", error=str(e))
+
+    async def _stream_execute(req: SimpleExecuteRequest) -> AsyncIterator[str]:
+        start_ns = time.perf_counter_ns()
+
+        try:
+            agent, chat_ctx, llm = await _begin_turn(req)
+
+            if not llm:
+                # Fallback if no LLM configured
+                reply_text = f"Echo: {req.message}"
+                logger.warning("No LLM configured, using echo response")
+                yield f"data: {_json.dumps(reply_text)}\n\n"
+            else:
+                # Forward chunks as they arrive, keeping them for the chat history
+                try:
+                    response_stream = llm.chat(chat_ctx=chat_ctx)
+
+                    chunks: list[str] = []
+                    async for text_chunk in response_stream.to_str_iterable():
+                        chunks.append(text_chunk)
+                        yield f"data: {_json.dumps(text_chunk)}\n\n"
+                    reply_text = "".join(chunks)
+
+                    logger.info("LLM response: %.100s...", reply_text)
+
+                except Exception as llm_error:
+                    logger.error("LLM execution failed: %s", llm_error, exc_info=True)
+                    raise _ExecuteError(f"LLM execution failed: {str(llm_error)}") from llm_error
+
+            resp = await _finish_turn(req, agent, chat_ctx, reply_text, start_ns)
+
+        except _ExecuteError as e:
+            resp = SimpleExecuteResponse(request_id=req.request_id, status="error", error=str(e))
+
+        yield f"event: done\ndata: {resp.model_dump_json()}\n\n"
+
+    async def _begin_turn(req: SimpleExecuteRequest) -> tuple[Any, Any, Any]:
+        """Check out an agent for the request and add the user message to its context.
+
+        Returns the agent, a working copy of its chat context and its LLM (falsy
+        when none is configured).
+        """
+        if state["agent_class"] is None:
+            raise _ExecuteError("Agent not loaded")
+
+        try:
+            # Provide previous state to auto-patch layer
+            prev_state = req.agent_state.model_dump() if req.agent_state else None
+            set_execution_context({"previous_state": prev_state, "user_id": req.user_id})
+
+            # Reuse the caller's pooled agent when there is state to restore onto it
+            # (checked out, so concurrent requests never share an instance);
+            # otherwise create a fresh one, which restores itself in __init__.
+            agent_cls = state["agent_class"]
+            agent = agent_pool.pop(req.user_id, None)
+            if agent is not None and type(agent) is agent_cls and prev_state and prev_state.get("chat_context"):
+                await restore_agent_state(agent, prev_state)
+            else:
+                if agent is not None:
+                    clear_agent_state(agent)
+                agent = agent_cls()
+                install_agent_hooks(agent)
+        except Exception as e:
+            logger.error("Error creating agent: %s", e, exc_info=True)
+            raise _ExecuteError(f"Agent creation failed: {str(e)}") from e
+
+        try:
+            # The agent is checked out to this request, so append to its own
+            # chat context instead of copying the history every turn
+            chat_ctx = editable_chat_ctx(agent) if state["has_chat_ctx"] else None
+            if chat_ctx is None:
+                # chat_ctx is a wrapped property that copies the history on every
+                # read, so check for it on the class and read it once
+                current_ctx = agent.chat_ctx if state["has_chat_ctx"] else None
+                if current_ctx is None:
+                    logger.error("Agent does not have chat_ctx initialized")
+                    raise _ExecuteError("Agent chat_ctx not initialized")
+
+                # Work on one copy of the chat context (it's read-only) for the whole
+                # turn and hand it back to the agent once, after the reply is added
+                chat_ctx = current_ctx.copy()
+            chat_ctx.add_message(role="user", content=req.message)
+            logger.debug("Added user message: %.50s...", req.message)
+
+            # Agent.llm is NOT_GIVEN (falsy) rather than None when unset
+            llm = getattr(agent, "llm", None)
+        except _ExecuteError:
+            raise
+        except Exception as e:
+            logger.error("Message processing failed: %s", e, exc_info=True)
+            raise _ExecuteError(f"Message processing failed: {str(e)}") from e
+
+        return agent, chat_ctx, llm
+
+    async def _finish_turn(
+        req: SimpleExecuteRequest, agent: Any, chat_ctx: Any, reply_text: str, start_ns: int
+    ) -> SimpleExecuteResponse:
+        """Commit the reply to the agent, capture its state and return it to the pool."""
+        try:
+            # Add assistant response and commit the turn to the agent
             if reply_text:
-                chat_ctx = agent.chat_ctx.copy()
                 chat_ctx.add_message(role="assistant", content=reply_text)
+            if chat_ctx is not editable_chat_ctx(agent):
                 await agent.update_chat_ctx(chat_ctx)
 
             # Trigger auto-capture by accessing chat_ctx
             _ = agent.chat_ctx
-            response_text = reply_text
-
         except Exception as e:
-            logger.error(f"Message processing failed: {e}", exc_info=True)
-            return SimpleExecuteResponse(
-                request_id=req.request_id,
-                status="error",
-                error=f"Message processing failed: {str(e)}"
-            )
+            logger.error("Message processing failed: %s", e, exc_info=True)
+            raise _ExecuteError(f"Message processing failed: {str(e)}") from e
 
         # Collect state
+        # Captured state is produced by our own serializer, so skip re-validating it
         captured = get_agent_state(agent)
-        updated_state = AgentStateModel(**captured)
+        updated_state = AgentStateModel.model_construct(**captured)
+        _release_agent(req.user_id, agent)
 
-        return SimpleExecuteResponse(
+        # Every field is server-built and already typed, so skip validation here too
+        return SimpleExecuteResponse.model_construct(
             request_id=req.request_id,
             status="success",
-            response=response_text,
+            response=reply_text,
             updated_state=updated_state,
-            metadata=ExecuteResponseMetadata(processing_time_ms=(time.time() - start) * 1000),
+            error=None,
+            metadata=ExecuteResponseMetadata.model_construct(
+                processing_time_ms=(time.perf_counter_ns() - start_ns) / 1e6
+            ),
         )
 
     return app
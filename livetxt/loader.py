@@ -7,15 +7,25 @@ without requiring any specific exports or naming conventions.
 
 from __future__ import annotations
 
+import functools
 import importlib.util
-import inspect
 import logging
 import sys
+import threading
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Executed agent modules by resolved path, with the mtime they were loaded at
+_MODULE_CACHE: dict[str, tuple[int, Any]] = {}
+
+# Directories this module has put on sys.path, so repeat loads skip the scan
+_INSERTED_PATHS: set[str] = set()
+
+# Serializes loads so concurrent callers execute each file only once
+_LOAD_LOCK = threading.RLock()
+
 
 def load_module_from_file(file_path: str | Path) -> Any:
     """
@@ -29,6 +39,10 @@ def load_module_from_file(file_path: str | Path) -> Any:
 
     Raises:
         ImportError: If the file cannot be loaded
+
+    Note:
+        The module is executed once per file modification; loading an
+        unchanged file again returns the module from the previous load.
     """
     file_path = Path(file_path).resolve()
 
@@ -38,28 +52,49 @@ def load_module_from_file(file_path: str | Path) -> Any:
     if not file_path.suffix == '.py':
         raise ValueError(f"File must be a Python file (.py): {file_path}")
 
-    # Generate module name from file
-    module_name = file_path.stem
+    mtime_ns = file_path.stat().st_mtime_ns
+    with _LOAD_LOCK:
+        cached = _MODULE_CACHE.get(str(file_path))
+        if cached is not None and cached[0] == mtime_ns:
+            logger.debug(f"Reusing loaded module for {file_path}")
+            return cached[1]
 
-    # Load the module
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    if spec is None or spec.loader is None:
-        raise ImportError(f"Could not load module from {file_path}")
+        # Generate module name from file
+        module_name = file_path.stem
+
+        # Load the module
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Could not load module from {file_path}")
 
-    module = importlib.util.module_from_spec(spec)
+        module = importlib.util.module_from_spec(spec)
 
-    # Add parent directory to sys.path so relative imports work
-    parent_dir = str(file_path.parent)
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
+        # Add parent directory to sys.path so relative imports work
+        parent_dir = str(file_path.parent)
+        if parent_dir not in _INSERTED_PATHS:
+            if parent_dir not in sys.path:
+                sys.path.insert(0, parent_dir)
+            _INSERTED_PATHS.add(parent_dir)
 
-    # Execute the module
-    spec.loader.exec_module(module)
+        # Execute the module
+        spec.loader.exec_module(module)
+        _MODULE_CACHE[str(file_path)] = (mtime_ns, module)
 
     logger.info(f"✅ Loaded module: {module_name} from {file_path}")
     return module
 
 
+@functools.cache
+def _agent_base_class() -> type | None:
+    """Resolve livekit.agents.Agent once (None if livekit-agents is missing)."""
+    try:
+        from livekit.agents import Agent
+    except ImportError:
+        logger.error("livekit-agents not installed")
+        return None
+    return Agent
+
+
 def find_agent_classes(module: Any) -> list[type]:
     """
     Find all Agent subclasses in a module.
@@ -68,27 +103,23 @@ def find_agent_classes(module: Any) -> list[type]:
         module: The module to search
 
     Returns:
-        List of Agent classes found
+        List of Agent classes found, ordered by name
     """
-    try:
-        from livekit.agents import Agent
-    except ImportError:
-        logger.error("livekit-agents not installed")
+    agent_base = _agent_base_class()
+    if agent_base is None:
         return []
 
     agent_classes = []
 
-    for name, obj in inspect.getmembers(module):
-        # Skip private members
-        if name.startswith('_'):
-            continue
-
-        # Check if it's a class
-        if not inspect.isclass(obj):
+    # Walk the namespace directly rather than inspect.getmembers(), which
+    # getattr()s every member; sorted to keep the by-name selection order.
+    for name, obj in sorted(vars(module).items()):
+        # Skip private members and anything that is not a class
+        if name.startswith('_') or not isinstance(obj, type):
             continue
 
         # Check if it's an Agent subclass (but not Agent itself)
-        if issubclass(obj, Agent) and obj is not Agent:
+        if issubclass(obj, agent_base) and obj is not agent_base:
             agent_classes.append(obj)
             logger.info(f"Found agent class: {obj.__name__}")
 
@@ -109,7 +140,22 @@ def load_agent_from_file(file_path: str | Path, agent_class_name: str | None = N
 
     Raises:
         ValueError: If no Agent class is found or if specified class is not found
+
+    Note:
+        Results are memoized on (path, mtime, class name), so reloading an
+        unchanged file does not re-execute it; editing the file invalidates it.
     """
+    file_path = Path(file_path).resolve()
+
+    if not file_path.exists():
+        raise FileNotFoundError(f"Agent file not found: {file_path}")
+
+    return _load_agent_cached(str(file_path), file_path.stat().st_mtime_ns, agent_class_name)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_agent_cached(file_path: str, mtime_ns: int, agent_class_name: str | None) -> type:
+    """Uncached body of load_agent_from_file; mtime_ns is only part of the key."""
     # Load the module
     module = load_module_from_file(file_path)
 
@@ -11,6 +11,8 @@ from typing import Any, Literal
 from livekit.agents.llm import ChatContext
 from pydantic import BaseModel, Field
 
+from .serialization import serialize_chat_context
+
 
 class SerializableSessionState(BaseModel):
     """
@@ -47,12 +49,7 @@ class SerializableSessionState(BaseModel):
             A new SerializableSessionState
         """
         # Serialize chat items to dict format
-        chat_dict = chat_ctx.to_dict(
-            exclude_image=True,  # Don't serialize images (too large)
-            exclude_audio=True,  # Don't serialize audio frames
-            exclude_timestamp=False,  # Keep timestamps for ordering
-            exclude_function_call=False,  # Keep function calls
-        )
+        chat_dict = serialize_chat_context(chat_ctx)
 
         return cls(chat_items=chat_dict.get("items", []), metadata=metadata or {})
 
@@ -87,6 +84,9 @@ class JobRequest(BaseModel):
     user_input: str
     """The text input from the user (e.g., SMS message content)."""
 
+    user_inputs: list[str] | None = None
+    """Further messages from the user, handled in order after user_input in the same job."""
+
     state: SerializableSessionState
     """The current conversation state."""
 
@@ -2,6 +2,8 @@
 
 import asyncio
 import logging
+import time
+from collections import OrderedDict
 from collections.abc import Callable
 from typing import Any
 
@@ -24,7 +26,16 @@ class LiveTxtWorker:
         self.config = config
         self.entrypoint = entrypoint
         self.client = LiveTxtClient(config)
-        self._active_sessions: dict[str, FakeJobContext] = {}
+        # session_id -> (last activity, context, entrypoint task), least recently
+        # active first
+        self._active_sessions: OrderedDict[
+            str, tuple[float, FakeJobContext, asyncio.Task]
+        ] = OrderedDict()
+        self._sweeper_task: asyncio.Task | None = None
+        # Caps how many entrypoints run at once; the rest wait their turn
+        self._sem = asyncio.Semaphore(config.max_concurrent_sessions)
+        # Strong references to running session tasks so they are not collected
+        self._session_tasks: set[asyncio.Task] = set()
 
     async def start(self) -> None:
         """Start the worker."""
@@ -39,15 +50,37 @@ class LiveTxtWorker:
 
         logger.info("🚀 LiveTxt worker started and ready")
 
-        # Keep running
+        self._sweeper_task = asyncio.create_task(self._sweep_idle_sessions())
+
+        # Keep running until the gateway connection closes
         try:
-            while self.client.is_connected():
-                await asyncio.sleep(1)
+            await self.client.wait_closed()
         except KeyboardInterrupt:
             logger.info("Shutting down...")
         finally:
+            if self._sweeper_task:
+                self._sweeper_task.cancel()
+            await self._stop_sessions()
             await self.client.disconnect()
 
+    async def _stop_sessions(self) -> None:
+        """
+        Flush and stop every session while the gateway socket is still open.
+
+        Disconnecting each room sends any debounced reply fragments; the tasks
+        are then cancelled and awaited so their shutdown callbacks finish first.
+        """
+        for session_id, (_, ctx, _) in list(self._active_sessions.items()):
+            try:
+                await ctx.disconnect()
+            except Exception as e:
+                logger.error("Error disconnecting session %s: %s", session_id, e)
+
+        tasks = list(self._session_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     async def _handle_message(self, data: dict[str, Any]) -> None:
         """
         Handle incoming message from gateway.
@@ -59,57 +92,109 @@ class LiveTxtWorker:
         message = data.get("message")
 
         if not session_id or not from_number or not message:
-            logger.error(f"Invalid message data: {data}")
+            logger.error("Invalid message data: %s", data)
             return
 
-        logger.info(f"📨 Message from {from_number} in session {session_id}: {message}")
+        logger.info("📨 Message from %s in session %s: %s", from_number, session_id, message)
 
         # Check if session already exists
-        if session_id in self._active_sessions:
+        entry = self._active_sessions.get(session_id)
+        if entry is not None:
             # Existing session - just inject the message
-            ctx = self._active_sessions[session_id]
+            _, ctx, task = entry
+            self._touch_session(session_id, ctx, task)
             await ctx.room.handle_incoming_message(message)
 
         else:
-            # New session - create context and run entrypoint
-            await self._handle_new_session(session_id, from_number, message)
-
-    async def _handle_new_session(self, session_id: str, from_number: str, message: str) -> None:
+            # New session - create context and run entrypoint in the background
+            # so a slow agent does not hold up messages for other sessions
+            logger.info("🆕 New session %s", session_id)
+
+            # Create fake JobContext and register it right away, so follow-up
+            # messages route to it while the entrypoint is still starting
+            ctx = FakeJobContext(
+                session_id=session_id,
+                user_phone=from_number,
+                client=self.client,
+                initial_message=message,
+                send_debounce=self.config.send_debounce,
+            )
+            task = asyncio.create_task(self._handle_new_session(session_id, ctx))
+            self._session_tasks.add(task)
+            task.add_done_callback(self._session_tasks.discard)
+            self._touch_session(session_id, ctx, task)
+
+    async def _handle_new_session(self, session_id: str, ctx: FakeJobContext) -> None:
         """Handle a new session by running the entrypoint."""
-        logger.info(f"🆕 New session {session_id}")
-
-        # Create fake JobContext
-        ctx = FakeJobContext(
-            session_id=session_id,
-            user_phone=from_number,
-            client=self.client,
-            initial_message=message,
-        )
-
-        # Store session
-        self._active_sessions[session_id] = ctx
+        # Evict the least recently active sessions if over capacity
+        while len(self._active_sessions) > self.config.max_sessions:
+            evicted_id, (_, evicted_ctx, evicted_task) = self._active_sessions.popitem(last=False)
+            await self._evict_session(
+                evicted_id, evicted_ctx, evicted_task, "session limit reached"
+            )
 
         try:
-            # Run the entrypoint
-            logger.info(f"Running entrypoint for session {session_id}")
+            async with self._sem:
+                # Run the entrypoint
+                logger.info("Running entrypoint for session %s", session_id)
 
-            if asyncio.iscoroutinefunction(self.entrypoint):
-                await self.entrypoint(ctx)
-            else:
-                self.entrypoint(ctx)
+                if asyncio.iscoroutinefunction(self.entrypoint):
+                    await self.entrypoint(ctx)
+                else:
+                    self.entrypoint(ctx)
 
         except Exception as e:
-            logger.error(f"Error in entrypoint for session {session_id}: {e}")
-            import traceback
-
-            traceback.print_exc()
+            logger.exception("Error in entrypoint for session %s: %s", session_id, e)
 
         finally:
-            # Clean up session
-            if session_id in self._active_sessions:
+            await ctx.run_shutdown_callbacks()
+
+            # Clean up session (unless it was evicted and the id reused)
+            entry = self._active_sessions.get(session_id)
+            if entry is not None and entry[1] is ctx:
                 del self._active_sessions[session_id]
 
-            logger.info(f"✅ Session {session_id} ended")
+            logger.info("✅ Session %s ended", session_id)
+
+    def _touch_session(self, session_id: str, ctx: FakeJobContext, task: asyncio.Task) -> None:
+        """Record activity on a session and mark it most recently used."""
+        self._active_sessions[session_id] = (time.monotonic(), ctx, task)
+        self._active_sessions.move_to_end(session_id)
+
+    async def _evict_session(
+        self, session_id: str, ctx: FakeJobContext, task: asyncio.Task, reason: str
+    ) -> None:
+        """
+        Drop a session: disconnect its fake room and stop its entrypoint.
+
+        Cancelling the task lets its finally block run the shutdown callbacks,
+        and releases the agent and handlers that keep the context alive.
+        """
+        logger.info("🧹 Evicting session %s: %s", session_id, reason)
+        try:
+            await ctx.disconnect()
+        except Exception as e:
+            logger.error("Error disconnecting session %s: %s", session_id, e)
+
+        if task is not asyncio.current_task():
+            task.cancel()
+            # wait() rather than await, so only our own cancellation propagates
+            await asyncio.wait((task,))
+
+    async def _sweep_idle_sessions(self) -> None:
+        """Periodically evict sessions idle for longer than the configured TTL."""
+        ttl = self.config.session_ttl
+        while True:
+            await asyncio.sleep(min(30.0, ttl))
+            cutoff = time.monotonic() - ttl
+
+            # Ordered by last activity, so stop at the first fresh session
+            while self._active_sessions:
+                session_id, (last_active, ctx, task) = next(iter(self._active_sessions.items()))
+                if last_active > cutoff:
+                    break
+                del self._active_sessions[session_id]
+                await self._evict_session(session_id, ctx, task, "idle timeout")
 
 
 async def run_worker(config: LiveTxtConfig, entrypoint: EntrypointFunction) -> None:
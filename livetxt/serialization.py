@@ -15,8 +15,22 @@ from typing import Any
 
 from livekit.agents import llm
 
+from . import _json
+
 logger = logging.getLogger(__name__)
 
+# Default number of user turns kept when restoring a conversation. Older turns are
+# dropped so prefill latency and token cost stay bounded on long conversations.
+DEFAULT_MAX_TURNS = 10
+
+# ChatContext.to_dict() options used for persisted state, built once
+_TO_DICT_KWARGS: dict[str, bool] = {
+    "exclude_image": True,  # Exclude images (too large for persistence)
+    "exclude_audio": True,  # Exclude audio (not needed for text mode)
+    "exclude_timestamp": False,  # Keep timestamps
+    "exclude_function_call": False,  # Keep function calls
+}
+
 
 def serialize_chat_context(chat_ctx: llm.ChatContext) -> dict[str, Any]:
     """
@@ -30,15 +44,23 @@ def serialize_chat_context(chat_ctx: llm.ChatContext) -> dict[str, Any]:
     Returns:
         A dictionary containing all chat items
     """
-    return chat_ctx.to_dict(
-        exclude_image=True,  # Exclude images (too large for persistence)
-        exclude_audio=True,  # Exclude audio (not needed for text mode)
-        exclude_timestamp=False,  # Keep timestamps
-        exclude_function_call=False,  # Keep function calls
-    )
+    return chat_ctx.to_dict(**_TO_DICT_KWARGS)
 
 
-def deserialize_chat_context(data: dict[str, Any]) -> llm.ChatContext:
+def serialize_chat_items(items: list[llm.ChatItem]) -> list[dict[str, Any]]:
+    """
+    Serialize chat items with the same options as serialize_chat_context().
+
+    Args:
+        items: The items to serialize, e.g. the newly appended tail of a context
+
+    Returns:
+        One dictionary per item, in order
+    """
+    return serialize_chat_context(llm.ChatContext(list(items)))["items"]
+
+
+def deserialize_chat_context(data: dict[str, Any], max_turns: int | None = None) -> llm.ChatContext:
     """
     Restore ChatContext from dict.
 
@@ -46,6 +68,7 @@ def deserialize_chat_context(data: dict[str, Any]) -> llm.ChatContext:
 
     Args:
         data: Dictionary containing serialized chat context
+        max_turns: If set, keep only the last N user turns (see trim_chat_context)
 
     Returns:
         A restored ChatContext
@@ -53,7 +76,48 @@ def deserialize_chat_context(data: dict[str, Any]) -> llm.ChatContext:
     if not data or not data.get("items"):
         return llm.ChatContext.empty()
 
-    return llm.ChatContext.from_dict(data)
+    chat_ctx = llm.ChatContext.from_dict(data)
+    if max_turns is not None:
+        trim_chat_context(chat_ctx, max_turns)
+    return chat_ctx
+
+
+def trim_chat_context(chat_ctx: llm.ChatContext, max_turns: int) -> llm.ChatContext:
+    """
+    Apply a sliding window to a ChatContext in place.
+
+    A turn starts at a user message and runs until the next one, so function
+    calls and their outputs are never split from the turn that produced them.
+    System/developer instructions from the dropped prefix are kept.
+
+    Args:
+        chat_ctx: The ChatContext to trim
+        max_turns: Number of most recent user turns to keep
+
+    Returns:
+        The same ChatContext, for chaining
+    """
+    if max_turns < 0:
+        raise ValueError("max_turns must be non-negative")
+
+    items = chat_ctx.items
+    turn_starts = [
+        i for i, item in enumerate(items) if item.type == "message" and item.role == "user"
+    ]
+    if len(turn_starts) <= max_turns:
+        return chat_ctx
+
+    cut = turn_starts[-max_turns] if max_turns else len(items)
+    instructions = [
+        item
+        for item in items[:cut]
+        if item.type == "message" and item.role in ("system", "developer")
+    ]
+    logger.debug(
+        "Trimmed %d chat items beyond the last %d turns", cut - len(instructions), max_turns
+    )
+    items[:] = instructions + items[cut:]
+    return chat_ctx
 
 
 def serialize_chat_item(item: llm.ChatItem) -> dict[str, Any]:
@@ -94,8 +158,6 @@ def serialize_function_tool_call(call: llm.FunctionToolCall) -> dict[str, Any]:
     Returns:
         A dictionary representation
     """
-    import json as _json
-
     # FunctionToolCall.arguments is a JSON string in livekit-agents
     try:
         arguments_obj = _json.loads(call.arguments) if isinstance(call.arguments, str) else call.arguments
@@ -119,8 +181,6 @@ def deserialize_function_tool_call(data: dict[str, Any]) -> llm.FunctionToolCall
     Returns:
         A restored FunctionToolCall
     """
-    import json as _json
-
     # Accept both 'name' and legacy 'function_name'
     name = data.get("name") or data.get("function_name")
     args = data.get("arguments", {})
@@ -153,8 +213,11 @@ def serialize_session_state(
     Returns:
         A complete serialized state dictionary
     """
+    # Idle sessions have an empty context; skip the to_dict() round trip for them.
+    # The result is built fresh each call since callers may mutate it.
+    has_items = chat_context is not None and bool(chat_context.items)
     return {
-        "chat_context": serialize_chat_context(chat_context) if chat_context else {"items": []},
+        "chat_context": serialize_chat_context(chat_context) if has_items else {"items": []},
         "function_calls": function_calls or [],
         "user_state": user_state,
         "agent_state": agent_state,
@@ -162,12 +225,16 @@ def serialize_session_state(
     }
 
 
-def deserialize_session_state(data: dict[str, Any]) -> dict[str, Any]:
+def deserialize_session_state(
+    data: dict[str, Any], max_turns: int | None = DEFAULT_MAX_TURNS
+) -> dict[str, Any]:
     """
     Deserialize agent session state.
 
     Args:
         data: Serialized state dictionary
+        max_turns: Keep only the last N user turns of the chat context
+            (None keeps the full history)
 
     Returns:
         Validated state dictionary with defaults for missing fields
@@ -178,7 +245,9 @@ def deserialize_session_state(data: dict[str, Any]) -> dict[str, Any]:
         logger.warning(f"Unknown state version: {version}, attempting to parse anyway")
 
     chat_context_data = data.get("chat_context", {"items": []})
-    chat_context = deserialize_chat_context(chat_context_data) if chat_context_data else None
+    chat_context = (
+        deserialize_chat_context(chat_context_data, max_turns=max_turns) if chat_context_data else None
+    )
 
     return {
         "chat_context": chat_context,
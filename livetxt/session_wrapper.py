@@ -13,6 +13,8 @@ from typing import Any
 from livekit.agents import Agent, llm
 
 from .serialization import (
+    DEFAULT_MAX_TURNS,
+    deserialize_chat_context,
     serialize_session_state,
 )
 
@@ -41,6 +43,8 @@ class LiveTxtSessionWrapper:
         state = wrapper.get_serializable_state()
     """
 
+    __slots__ = ("agent", "captured_state")
+
     def __init__(self, agent: Agent):
         """
         Initialize the wrapper around an agent.
@@ -56,7 +60,7 @@ class LiveTxtSessionWrapper:
             "events": [],  # Optional: track events for debugging
         }
 
-        logger.debug(f"LiveTxtSessionWrapper initialized for agent: {type(agent).__name__}")
+        logger.debug("LiveTxtSessionWrapper initialized for agent: %s", type(agent).__name__)
 
     def capture_function_call(
         self, function_name: str, arguments: dict[str, Any], result: Any = None, error: str | None = None
@@ -80,7 +84,7 @@ class LiveTxtSessionWrapper:
             "timestamp": None,  # Could add timestamp if needed
         }
         self.captured_state["function_calls"].append(call_info)
-        logger.debug(f"Captured function call: {function_name}")
+        logger.debug("Captured function call: %s", function_name)
 
     def capture_event(self, event_type: str, data: dict[str, Any]) -> None:
         """
@@ -92,7 +96,7 @@ class LiveTxtSessionWrapper:
         """
         event_info = {"type": event_type, "data": data}
         self.captured_state["events"].append(event_info)
-        logger.debug(f"Captured event: {event_type}")
+        logger.debug("Captured event: %s", event_type)
 
     def update_user_state(self, state: str) -> None:
         """
@@ -102,7 +106,7 @@ class LiveTxtSessionWrapper:
             state: New user state (e.g., "listening", "speaking")
         """
         self.captured_state["user_state"] = state
-        logger.debug(f"User state updated: {state}")
+        logger.debug("User state updated: %s", state)
 
     def update_agent_state(self, state: str) -> None:
         """
@@ -112,7 +116,7 @@ class LiveTxtSessionWrapper:
             state: New agent state (e.g., "idle", "thinking", "speaking")
         """
         self.captured_state["agent_state"] = state
-        logger.debug(f"Agent state updated: {state}")
+        logger.debug("Agent state updated: %s", state)
 
     def get_chat_context(self) -> llm.ChatContext | None:
         """
@@ -155,14 +159,12 @@ class LiveTxtSessionWrapper:
         """
         # Restore chat context if available
         if "chat_context" in state and state["chat_context"]:
-            from .serialization import deserialize_chat_context
-
-            restored_ctx = deserialize_chat_context(state["chat_context"])
+            restored_ctx = deserialize_chat_context(state["chat_context"], max_turns=DEFAULT_MAX_TURNS)
 
             # Update agent's chat context
             if hasattr(self.agent, "update_chat_ctx"):
                 self.agent.update_chat_ctx(restored_ctx)
-                logger.info(f"Restored {len(restored_ctx.items)} chat items to agent")
+                logger.info("Restored %s chat items to agent", len(restored_ctx.items))
             else:
                 logger.warning("Agent does not support update_chat_ctx()")
 
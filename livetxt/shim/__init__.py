@@ -1,6 +1,6 @@
 """Shim layer that makes LiveKit agents work with SMS."""
 
 from .context import FakeJobContext, FakeParticipant, FakeRoom
-from .patch import patch_livekit
+from .patch import patch_livekit, patch_tool_schema_cache
 
-__all__ = ["FakeJobContext", "FakeRoom", "FakeParticipant", "patch_livekit"]
+__all__ = ["FakeJobContext", "FakeRoom", "FakeParticipant", "patch_livekit", "patch_tool_schema_cache"]
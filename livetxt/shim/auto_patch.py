@@ -10,17 +10,42 @@ This module transparently wraps livekit-agents Agent class to:
 
 from __future__ import annotations
 
+import contextvars
 import functools
 import logging
+import weakref
 from collections.abc import Callable
 from typing import Any
 
+from .patch import patch_tool_schema_cache
+
 logger = logging.getLogger(__name__)
 
 # Global state storage
 _PATCHING_APPLIED = False
-_AGENT_STATES: dict[int, dict[str, Any]] = {}
-_CURRENT_CONTEXT: dict[str, Any] = {}
+# Per-agent capture records:
+#   {"dirty": bool, "state": dict | None, "items": list, "version": tuple | None}.
+# Reading chat_ctx only marks the record dirty; serialization waits for
+# get_agent_state(). "items" pairs each chat item with its serialized dict, and
+# "version" is the _state_version() the current snapshot was taken at.
+# Keyed by the agent itself and held weakly, so records go away with their agent
+# even when clear_agent_state() is never called.
+_AGENT_STATES: weakref.WeakKeyDictionary[Any, dict[str, Any]] = weakref.WeakKeyDictionary()
+# Execution context of the current task, so concurrent requests each see their own
+_CURRENT_CONTEXT: contextvars.ContextVar[dict[str, Any] | None] = contextvars.ContextVar(
+    "livetxt_execution_context", default=None
+)
+
+# Function tool attribute names per agent class, found once per class
+_TOOL_METHODS_CACHE: dict[type, tuple[str, ...]] = {}
+
+
+@functools.cache
+def _serialization() -> Any:
+    """Import livetxt.serialization once; it needs livekit-agents, so not at module load."""
+    from .. import serialization
+
+    return serialization
 
 
 def set_execution_context(context: dict[str, Any]) -> None:
@@ -28,36 +53,138 @@ def set_execution_context(context: dict[str, Any]) -> None:
     Set context for current execution.
 
     This is called by the worker before running an agent to provide
-    previous state and user context.
+    previous state and user context. The context is scoped to the calling
+    task (and tasks it starts afterwards), so concurrent requests don't
+    see each other's state.
     """
-    global _CURRENT_CONTEXT
-    _CURRENT_CONTEXT = context
-    logger.debug(f"Execution context set: {list(context.keys())}")
+    _CURRENT_CONTEXT.set(context)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Execution context set: %s", list(context.keys()))
 
 
 def get_agent_state(agent: Any) -> dict[str, Any]:
-    """Get automatically captured state for an agent."""
-    agent_id = id(agent)
-    return _AGENT_STATES.get(agent_id, {
-        "chat_context": None,
-        "function_calls": [],
-        "user_state": "listening",
-        "agent_state": "idle",
-    })
+    """
+    Get automatically captured state for an agent.
+
+    The chat context is serialized here, on demand, if it has been read since
+    the last call; agents whose chat_ctx was never read get the empty state.
+    """
+    record = _AGENT_STATES.get(agent)
+    if record is None:
+        return {
+            "chat_context": None,
+            "function_calls": [],
+            "user_state": "listening",
+            "agent_state": "idle",
+        }
+
+    if record["dirty"]:
+        # A read does not mean a change; recapture only if the state moved on
+        version = _state_version(agent)
+        if not _same_version(version, record["version"]):
+            record["state"] = _auto_capture_state(agent, record)
+            record["version"] = version
+        record["dirty"] = False
+    return record["state"]
 
 
 def clear_agent_state(agent: Any) -> None:
     """Clear captured state for an agent (cleanup)."""
-    agent_id = id(agent)
-    if agent_id in _AGENT_STATES:
-        del _AGENT_STATES[agent_id]
+    _AGENT_STATES.pop(agent, None)
+
 
+async def restore_agent_state(agent: Any, state: dict[str, Any]) -> None:
+    """
+    Replace an existing agent's conversation state with a previous snapshot.
 
-def _auto_capture_state(agent: Any) -> None:
-    """Automatically capture current state from agent."""
-    from ..serialization import serialize_chat_context
+    Used when an agent instance is reused across requests; freshly created
+    agents are restored from the execution context in __init__ instead.
+    """
+    serialization = _serialization()
+    restored_ctx = serialization.deserialize_chat_context(
+        state.get("chat_context") or {}, max_turns=serialization.DEFAULT_MAX_TURNS
+    )
+    await agent.update_chat_ctx(restored_ctx)
+    agent._livetxt_function_calls = list(state.get("function_calls") or [])
+    logger.debug("Restored %s chat items onto reused agent", len(restored_ctx.items))
+
+
+def editable_chat_ctx(agent: Any) -> Any | None:
+    """
+    Return the agent's own chat context for appending to in place.
+
+    Agent.chat_ctx hands out a read-only copy, and update_chat_ctx() copies
+    again, so a turn would clone the whole history twice. An agent that is not
+    attached to a running session only stores its context, so callers that own
+    the agent may append to it directly. Returns None when that is not safe;
+    callers then fall back to copy() and update_chat_ctx().
+    """
+    if getattr(agent, "_activity", None) is not None:
+        return None
+    return getattr(agent, "_chat_ctx", None)
+
+
+def _mark_state_dirty(agent: Any) -> None:
+    """Note that the agent's state may have changed (O(1); nothing is serialized)."""
+    record = _AGENT_STATES.get(agent)
+    if record is None:
+        _AGENT_STATES[agent] = {"dirty": True, "state": None, "items": [], "version": None}
+    else:
+        record["dirty"] = True
+
+
+def _state_version(agent: Any) -> tuple[Any, int, Any, Any]:
+    """
+    Cheap fingerprint of the state a capture depends on.
 
-    agent_id = id(agent)
+    update_chat_ctx() swaps in a new ChatContext and appends grow the item
+    list, so the context object, its length and its last item change whenever
+    the history does; the function call list is replaced on restore.
+    """
+    chat_ctx = getattr(agent, '_chat_ctx', None)
+    items = chat_ctx.items if chat_ctx is not None else ()
+    # Agents created before patching may never have had the list installed
+    function_calls = getattr(agent, '_livetxt_function_calls', None)
+    return (chat_ctx, len(items), items[-1] if items else None, function_calls)
+
+
+def _same_version(current: tuple[Any, int, Any, Any], previous: tuple[Any, int, Any, Any] | None) -> bool:
+    if previous is None:
+        return False
+    return (
+        current[0] is previous[0]
+        and current[1] == previous[1]
+        and current[2] is previous[2]
+        and current[3] is previous[3]
+    )
+
+
+def _serialize_items_incremental(chat_ctx: Any, record: dict[str, Any]) -> dict[str, Any]:
+    """
+    Serialize a chat context, reusing dicts from the previous capture.
+
+    History normally only grows, so the leading items are the same objects as
+    last time and only the appended ones need serializing. A context that was
+    replaced or trimmed diverges at the first changed item and is redone from there.
+    """
+    items = chat_ctx.items
+    cached = record["items"]
+
+    reused = 0
+    limit = min(len(cached), len(items))
+    while reused < limit and cached[reused][0] is items[reused]:
+        reused += 1
+
+    new_items = items[reused:]
+    if new_items or reused < len(cached):
+        new_dicts = _serialization().serialize_chat_items(new_items)
+        record["items"] = cached = cached[:reused] + list(zip(new_items, new_dicts, strict=True))
+
+    return {"items": [serialized for _, serialized in cached]}
+
+
+def _auto_capture_state(agent: Any, record: dict[str, Any]) -> dict[str, Any]:
+    """Capture current state from agent."""
     state: dict[str, Any] = {
         "chat_context": None,
         "function_calls": getattr(agent, '_livetxt_function_calls', []),
@@ -69,20 +196,26 @@ def _auto_capture_state(agent: Any) -> None:
     # Access _chat_ctx directly to avoid triggering the wrapped property and recursion
     if hasattr(agent, '_chat_ctx') and agent._chat_ctx is not None:
         try:
-            state["chat_context"] = serialize_chat_context(agent._chat_ctx)
-            logger.debug(f"Captured chat_ctx with {len(agent._chat_ctx.items)} items")
+            state["chat_context"] = _serialize_items_incremental(agent._chat_ctx, record)
+            logger.debug("Captured chat_ctx with %s items", len(agent._chat_ctx.items))
         except Exception as e:
             logger.warning(f"Failed to serialize chat_ctx: {e}")
 
-    _AGENT_STATES[agent_id] = state
+    return state
 
 
 def _auto_restore_state(agent: Any) -> None:
-    """Automatically restore state to agent from context."""
-    from ..serialization import deserialize_chat_context
+    """
+    Automatically restore state to agent from context.
+
+    The previous state's function call list is handed over to the agent rather
+    than copied, so it is consumed by the first agent restored from it.
+    """
+    serialization = _serialization()
 
     # Get state from current execution context
-    state = _CURRENT_CONTEXT.get("previous_state")
+    context = _CURRENT_CONTEXT.get()
+    state = context.get("previous_state") if context else None
     if not state:
         logger.debug("No previous state to restore")
         return
@@ -90,19 +223,21 @@ def _auto_restore_state(agent: Any) -> None:
     # Restore chat context
     if "chat_context" in state and state["chat_context"]:
         try:
-            restored_ctx = deserialize_chat_context(state["chat_context"])
-            if hasattr(agent, 'update_chat_ctx'):
-                agent.update_chat_ctx(restored_ctx)
-                logger.info(f"✅ Auto-restored {len(restored_ctx.items)} chat items")
-            else:
-                # Fallback: set directly
-                agent._chat_ctx = restored_ctx
+            restored_ctx = serialization.deserialize_chat_context(
+                state["chat_context"], max_turns=serialization.DEFAULT_MAX_TURNS
+            )
+            # update_chat_ctx() is async and can't be awaited from __init__; an
+            # agent under construction has no activity, so for it that call only
+            # stores the context anyway. Set it directly.
+            agent._chat_ctx = restored_ctx
+            logger.info("✅ Auto-restored %s chat items", len(restored_ctx.items))
         except Exception as e:
             logger.warning(f"Failed to restore chat_ctx: {e}")
 
-    # Restore function call history
-    if "function_calls" in state:
-        agent._livetxt_function_calls = state["function_calls"].copy()
+    # Restore function call history (moved, not copied)
+    function_calls = state.pop("function_calls", None)
+    if function_calls is not None:
+        agent._livetxt_function_calls = function_calls
 
 
 def _wrap_agent_init(original_init: Callable) -> Callable:
@@ -113,20 +248,21 @@ def _wrap_agent_init(original_init: Callable) -> Callable:
         # Call original init
         result = original_init(self, *args, **kwargs)
 
-        # Initialize function call tracking
+        # Initialize function call tracking. Every agent has this list from
+        # here on, so the capture and tool-tracking paths use it unguarded.
         self._livetxt_function_calls = []
 
         # Auto-restore state if available
         _auto_restore_state(self)
 
-        logger.debug(f"Agent initialized with auto-restore: {type(self).__name__}")
+        logger.debug("Agent initialized with auto-restore: %s", type(self).__name__)
         return result
 
     return wrapped_init
 
 
 def _wrap_chat_ctx_property(agent_class: type) -> None:
-    """Wrap chat_ctx property to auto-capture on access."""
+    """Wrap chat_ctx property to mark state for capture on access."""
 
     # Get original property
     original_property = None
@@ -140,79 +276,97 @@ def _wrap_chat_ctx_property(agent_class: type) -> None:
         return
 
     original_fget = original_property.fget
+    if original_fget is None:
+        logger.warning("chat_ctx property has no getter to wrap")
+        return
 
     def wrapped_fget(self: Any) -> Any:
-        """Get chat_ctx and auto-capture state."""
-        ctx = original_fget(self) if original_fget else self._chat_ctx
+        """Get chat_ctx and mark state for capture."""
+        ctx = original_fget(self)
 
-        # Auto-capture state when chat_ctx is accessed
-        # (This captures after agent has processed/updated context)
-        _auto_capture_state(self)
+        # LiveKit reads chat_ctx constantly, so only flag the state here;
+        # get_agent_state() serializes it once when it is actually needed
+        _mark_state_dirty(self)
 
         return ctx
 
-    # Replace property
+    # Replace property, keeping any setter/deleter
     agent_class.chat_ctx = property(
-        fget=wrapped_fget,
-        fset=original_property.fset if hasattr(original_property, 'fset') else None,
-        doc=original_property.__doc__
+        wrapped_fget, original_property.fset, original_property.fdel, original_property.__doc__
     )
 
 
+def _is_tool_attr(value: Any) -> bool:
+    """Check a raw class attribute for function tool metadata."""
+    if isinstance(value, (staticmethod, classmethod)):
+        value = value.__func__
+    return callable(value) and (hasattr(value, '__wrapped__') or hasattr(value, '_is_function_tool'))
+
+
+def _tool_names(cls: type) -> tuple[str, ...]:
+    """Names of the function tools defined on an agent class (and its bases)."""
+    names = _TOOL_METHODS_CACHE.get(cls)
+    if names is None:
+        # Look at the raw class dicts so no descriptor or property is evaluated
+        found: list[str] = []
+        seen: set[str] = set()
+        for klass in cls.__mro__:
+            for name, value in vars(klass).items():
+                if name in seen:
+                    continue
+                seen.add(name)
+                if not name.startswith('_') and _is_tool_attr(value):
+                    found.append(name)
+        names = _TOOL_METHODS_CACHE[cls] = tuple(found)
+    return names
+
+
+def _track_tool_calls(agent: Any, original_func: Callable) -> Callable:
+    """Wrap one bound tool so its calls are recorded on the agent."""
+    func_name = original_func.__name__
+
+    @functools.wraps(original_func)
+    async def wrapped_tool(*args: Any, **kwargs: Any) -> Any:
+        logger.debug("Function tool called: %s", func_name)
+
+        # Call original function
+        try:
+            result = await original_func(*args, **kwargs)
+
+            # Track the call
+            agent._livetxt_function_calls.append({
+                "function_name": func_name,
+                "arguments": kwargs,
+                "result": result,
+                "error": None
+            })
+
+            return result
+        except Exception as e:
+            # Track error
+            agent._livetxt_function_calls.append({
+                "function_name": func_name,
+                "arguments": kwargs,
+                "result": None,
+                "error": str(e)
+            })
+            raise
+
+    return wrapped_tool
+
+
 def _wrap_function_tools(agent: Any) -> None:
     """Wrap function tools to auto-track calls."""
 
-    # Find all methods decorated with @llm.function_tool()
-    for attr_name in dir(agent):
+    # Only the methods decorated with @llm.function_tool() are looked up
+    for attr_name in _tool_names(type(agent)):
         try:
             attr = getattr(agent, attr_name)
 
-            # Check if it's a function tool (has metadata from decorator)
-            if not callable(attr) or attr_name.startswith('_'):
-                continue
-
-            # If it has function tool metadata, wrap it
-            if hasattr(attr, '__wrapped__') or hasattr(attr, '_is_function_tool'):
-                original_func = attr
-
-                @functools.wraps(original_func)
-                async def wrapped_tool(*args: Any, **kwargs: Any) -> Any:
-                    func_name = original_func.__name__
-                    logger.debug(f"Function tool called: {func_name}")
-
-                    # Call original function
-                    try:
-                        result = await original_func(*args, **kwargs)
-
-                        # Track the call
-                        if not hasattr(agent, '_livetxt_function_calls'):
-                            agent._livetxt_function_calls = []
-
-                        agent._livetxt_function_calls.append({
-                            "function_name": func_name,
-                            "arguments": kwargs,
-                            "result": result,
-                            "error": None
-                        })
-
-                        return result
-                    except Exception as e:
-                        # Track error
-                        if not hasattr(agent, '_livetxt_function_calls'):
-                            agent._livetxt_function_calls = []
-
-                        agent._livetxt_function_calls.append({
-                            "function_name": func_name,
-                            "arguments": kwargs,
-                            "result": None,
-                            "error": str(e)
-                        })
-                        raise
-
-                # Replace method
-                setattr(agent, attr_name, wrapped_tool)
+            # Replace method
+            setattr(agent, attr_name, _track_tool_calls(agent, attr))
         except Exception as e:
-            logger.debug(f"Could not wrap {attr_name}: {e}")
+            logger.debug("Could not wrap %s: %s", attr_name, e)
 
 
 def patch_livekit_auto() -> None:
@@ -228,6 +382,8 @@ def patch_livekit_auto() -> None:
         logger.debug("Auto-patching already applied")
         return
 
+    patch_tool_schema_cache()
+
     try:
         from livekit.agents import Agent
 
@@ -258,7 +414,10 @@ def install_agent_hooks(agent: Any) -> None:
     This is called after agent is instantiated to wrap function tools.
     """
     try:
+        # Agents created before patching missed the __init__ hook
+        if not hasattr(agent, '_livetxt_function_calls'):
+            agent._livetxt_function_calls = []
         _wrap_function_tools(agent)
-        logger.debug(f"Installed hooks on agent: {type(agent).__name__}")
+        logger.debug("Installed hooks on agent: %s", type(agent).__name__)
     except Exception as e:
         logger.warning(f"Failed to install agent hooks: {e}")
@@ -10,10 +10,16 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Longest time the initial message waits for the agent to register a
+# data_received handler before it is delivered regardless
+INITIAL_MESSAGE_WAIT = 0.5
+
 
 class FakeParticipant:
     """Fake participant representing an SMS user."""
 
+    __slots__ = ("identity", "name", "sid", "metadata", "kind", "attributes")
+
     def __init__(self, identity: str, name: str = "", metadata: str = ""):
         self.identity = identity
         self.name = name or identity
@@ -31,28 +37,64 @@ class FakeParticipant:
     async def set_attributes(self, attributes: dict) -> None:
         """Set participant attributes (needed by AgentSession)."""
         self.attributes.update(attributes)
-        logger.debug(f"FakeParticipant.set_attributes: {attributes}")
+        logger.debug("FakeParticipant.set_attributes: %s", attributes)
 
     def get(self, key: str, default=None):
         """Get attribute value."""
         return self.attributes.get(key, default)
 
 
+class LocalFakeParticipant(FakeParticipant):
+    """The agent's own participant; routes published data through its room."""
+
+    __slots__ = ("_room",)
+
+    def __init__(self, room: FakeRoom, identity: str, name: str = "", metadata: str = ""):
+        super().__init__(identity, name, metadata)
+        self._room = room
+
+    async def publish_data(self, data: bytes, *, topic: str = "", reliable: bool = True) -> None:
+        """Capture an agent response and send it to the gateway."""
+        await self._room._intercept_publish_data(data, topic=topic, reliable=reliable)
+
+
 class FakeRoom:
     """
     Fake LiveKit room that routes to SMS backend.
     Implements enough of livekit.rtc.Room API to fool agent code.
     """
 
+    # One per SMS session; __weakref__ kept since rtc.Room supports weak references
+    __slots__ = (
+        "name",
+        "sid",
+        "metadata",
+        "local_participant",
+        "_client",
+        "_session_id",
+        "_user_phone",
+        "_initial_message",
+        "_send_debounce",
+        "_send_buffer",
+        "_send_task",
+        "_event_handlers",
+        "_event_dispatch",
+        "_data_handler_ready",
+        "_remote_participant",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         session_id: str,
         user_phone: str,
         client: Any,  # LiveTxtClient
         initial_message: str | None = None,
+        send_debounce: float = 0.0,
     ):
         self.name = session_id
         self.sid = f"RM_sms_{session_id}"
+        # Encoded once and shared with the remote participant and ctx.job
         self.metadata = json.dumps({"phone": user_phone})
 
         self._client = client
@@ -60,11 +102,24 @@ class FakeRoom:
         self._user_phone = user_phone
         self._initial_message = initial_message
 
+        # Outbound fragments published within send_debounce seconds of each
+        # other are joined into one gateway message (0 sends each immediately)
+        self._send_debounce = send_debounce
+        self._send_buffer: list[str] = []
+        self._send_task: asyncio.Task | None = None
+
         # Event handlers
         self._event_handlers: dict[str, list[Callable]] = {}
-
-        # Participants
-        self.local_participant = FakeParticipant(
+        # Per event, (handler, is_async) pairs in registration order, rebuilt on
+        # (un)registration so emitting does no per-handler introspection
+        self._event_dispatch: dict[str, tuple[tuple[Callable, bool], ...]] = {}
+        # Set once the agent listens for data_received, so the initial message
+        # can be delivered as soon as someone is there to receive it
+        self._data_handler_ready = asyncio.Event()
+
+        # Participants; the local one hands agent responses to _intercept_publish_data
+        self.local_participant = LocalFakeParticipant(
+            self,
             identity="agent",
             name="SMS Agent",
         )
@@ -73,12 +128,9 @@ class FakeRoom:
         self._remote_participant = FakeParticipant(
             identity=f"sms_{user_phone}",
             name=user_phone,
-            metadata=json.dumps({"phone": user_phone}),
+            metadata=self.metadata,
         )
 
-        # Hook into local participant's publish_data to capture agent responses
-        self.local_participant.publish_data = self._intercept_publish_data
-
     @property
     def remote_participants(self) -> dict[str, FakeParticipant]:
         """Get remote participants."""
@@ -90,18 +142,18 @@ class FakeRoom:
 
     def on(self, event: str, callback: Callable | None = None) -> Callable | None:
         """Register an event handler."""
-        if callback is None:
-            # Decorator usage
-            def decorator(func: Callable) -> Callable:
-                self._register_handler(event, func)
-                return func
-
-            return decorator
-        else:
+        if callback is not None:
             # Direct usage
             self._register_handler(event, callback)
             return callback
 
+        # Decorator usage; the closure is only built when it is needed
+        def decorator(func: Callable) -> Callable:
+            self._register_handler(event, func)
+            return func
+
+        return decorator
+
     def off(self, event: str, callback: Callable | None = None) -> None:
         """Unregister an event handler."""
         if event not in self._event_handlers:
@@ -113,18 +165,36 @@ class FakeRoom:
             # Remove specific handler
             if callback in self._event_handlers[event]:
                 self._event_handlers[event].remove(callback)
+        self._update_dispatch(event)
 
     def _register_handler(self, event: str, callback: Callable) -> None:
         """Register an event handler."""
         if event not in self._event_handlers:
             self._event_handlers[event] = []
         self._event_handlers[event].append(callback)
+        self._update_dispatch(event)
+
+    def _update_dispatch(self, event: str) -> None:
+        """Rebuild the emit list for an event after its handlers changed."""
+        handlers = self._event_handlers.get(event)
+        if handlers:
+            self._event_dispatch[event] = tuple(
+                (handler, asyncio.iscoroutinefunction(handler)) for handler in handlers
+            )
+            if event == "data_received":
+                self._data_handler_ready.set()
+        else:
+            self._event_dispatch.pop(event, None)
 
     async def _emit_event(self, event: str, *args: Any, **kwargs: Any) -> None:
         """Trigger registered event handlers."""
-        for handler in self._event_handlers.get(event, []):
+        dispatch = self._event_dispatch.get(event)
+        if dispatch is None:
+            return
+
+        for handler, is_async in dispatch:
             try:
-                if asyncio.iscoroutinefunction(handler):
+                if is_async:
                     await handler(*args, **kwargs)
                 else:
                     handler(*args, **kwargs)
@@ -135,7 +205,7 @@ class FakeRoom:
         self, url: str | None = None, token: str | None = None, **kwargs: Any
     ) -> None:
         """Fake connection to room."""
-        logger.info(f"Agent connecting to fake room {self.name}")
+        logger.info("Agent connecting to fake room %s", self.name)
 
         # Emit participant_connected for the user
         await self._emit_event("participant_connected", self._remote_participant)
@@ -146,35 +216,33 @@ class FakeRoom:
 
     async def disconnect(self) -> None:
         """Fake disconnection."""
-        logger.info(f"Agent disconnecting from room {self.name}")
-
-    def register_byte_stream_handler(self, *args: Any, **kwargs: Any) -> None:
-        """Fake method - not needed in SMS mode."""
-        logger.debug("register_byte_stream_handler called (no-op in SMS mode)")
-
-    def register_text_stream_handler(self, *args: Any, **kwargs: Any) -> None:
-        """Fake method - not needed in SMS mode."""
-        logger.debug("register_text_stream_handler called (no-op in SMS mode)")
-
-    def register_audio_stream_handler(self, *args: Any, **kwargs: Any) -> None:
-        """Fake method - not needed in SMS mode."""
-        logger.debug("register_audio_stream_handler called (no-op in SMS mode)")
-
-    def unregister_byte_stream_handler(self, *args: Any, **kwargs: Any) -> None:
-        """Fake method - not needed in SMS mode."""
-        logger.debug("unregister_byte_stream_handler called (no-op in SMS mode)")
-
-    def unregister_text_stream_handler(self, *args: Any, **kwargs: Any) -> None:
-        """Fake method - not needed in SMS mode."""
-        logger.debug("unregister_text_stream_handler called (no-op in SMS mode)")
-
-    def unregister_audio_stream_handler(self, *args: Any, **kwargs: Any) -> None:
-        """Fake method - not needed in SMS mode."""
-        logger.debug("unregister_audio_stream_handler called (no-op in SMS mode)")
+        logger.info("Agent disconnecting from room %s", self.name)
+
+        # Don't leave buffered response fragments behind
+        task, self._send_task = self._send_task, None
+        if task:
+            task.cancel()
+        await self.flush()
+
+    def _ignore_stream_handler(self, *args: Any, **kwargs: Any) -> None:
+        """Fake method - stream handlers are not needed in SMS mode."""
+        logger.debug("Stream handler (un)registration ignored in SMS mode")
+
+    # Explicit names keep the rtc.Room API visible; all share the one no-op
+    register_byte_stream_handler = _ignore_stream_handler
+    register_text_stream_handler = _ignore_stream_handler
+    register_audio_stream_handler = _ignore_stream_handler
+    unregister_byte_stream_handler = _ignore_stream_handler
+    unregister_text_stream_handler = _ignore_stream_handler
+    unregister_audio_stream_handler = _ignore_stream_handler
 
     async def _inject_initial_message(self) -> None:
         """Inject the initial SMS message as a data_received event."""
-        await asyncio.sleep(0.5)  # Give agent time to set up handlers
+        # Give agent time to set up handlers, but no longer than it needs
+        try:
+            await asyncio.wait_for(self._data_handler_ready.wait(), timeout=INITIAL_MESSAGE_WAIT)
+        except asyncio.TimeoutError:
+            logger.debug("No data_received handler after %ss, delivering anyway", INITIAL_MESSAGE_WAIT)
 
         # Emit data_received event
         data = self._initial_message.encode("utf-8") if self._initial_message else b""
@@ -194,17 +262,42 @@ class FakeRoom:
         try:
             # Agent is sending a response
             message = data.decode("utf-8") if isinstance(data, bytes) else str(data)
-            logger.info(f"Agent response: {message}")
+            logger.info("Agent response: %s", message)
 
-            # Send response to gateway
-            await self._client.send_response(self._session_id, message)
+            if self._send_debounce <= 0:
+                # Send response to gateway
+                await self._client.send_response(self._session_id, message)
+                return
+
+            # Buffer it; the first fragment schedules the flush
+            self._send_buffer.append(message)
+            if self._send_task is None:
+                self._send_task = asyncio.create_task(self._flush_later())
+
+        except Exception as e:
+            logger.error(f"Error sending response: {e}")
+
+    async def _flush_later(self) -> None:
+        """Flush buffered fragments once the debounce window has passed."""
+        await asyncio.sleep(self._send_debounce)
+        self._send_task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Send buffered response fragments to the gateway as one message."""
+        if not self._send_buffer:
+            return
 
+        message = "".join(self._send_buffer)
+        self._send_buffer.clear()
+        try:
+            await self._client.send_response(self._session_id, message)
         except Exception as e:
             logger.error(f"Error sending response: {e}")
 
     async def handle_incoming_message(self, message: str) -> None:
         """Handle an incoming message from the gateway."""
-        logger.info(f"Incoming message: {message}")
+        logger.info("Incoming message: %s", message)
 
         # Emit as data_received event
         data = message.encode("utf-8")
@@ -216,37 +309,57 @@ class FakeRoom:
         )
 
 
+class _FakeRoomInfo:
+    """Room info exposed as ``ctx.job.room``."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class _FakeJob:
+    """Job description exposed as ``ctx.job``."""
+
+    __slots__ = ("id", "type", "room", "agent_name", "metadata")
+
+    def __init__(self, session_id: str, metadata: str):
+        self.id = session_id
+        self.type = "room"
+        self.room = _FakeRoomInfo(session_id)
+        self.agent_name = "sms-agent"
+        self.metadata = metadata
+
+
 class FakeJobContext:
     """
     Fake JobContext that agent code receives.
     Implements enough of livekit.agents.JobContext to work.
     """
 
+    # One instance per SMS session, so keep them small
+    __slots__ = ("job", "room", "log_context_fields", "_client", "_session_id", "_shutdown_callbacks")
+
     def __init__(
         self,
         session_id: str,
         user_phone: str,
         client: Any,
         initial_message: str | None = None,
+        send_debounce: float = 0.0,
     ):
-        # Create fake job object
-        self.job = type(
-            "Job",
-            (),
-            {
-                "id": session_id,
-                "type": "room",
-                "room": type("RoomInfo", (), {"name": session_id})(),
-                "agent_name": "sms-agent",
-                "metadata": json.dumps({"phone": user_phone}),
-            },
-        )()
-
         # Create fake room
-        self.room = FakeRoom(session_id, user_phone, client, initial_message)
+        self.room = FakeRoom(session_id, user_phone, client, initial_message, send_debounce)
+
+        # Create fake job object (shares the room's metadata string)
+        self.job = _FakeJob(session_id, self.room.metadata)
+
+        # Extra fields agents attach to their log records
+        self.log_context_fields: dict[str, Any] = {}
 
         self._client = client
         self._session_id = session_id
+        self._shutdown_callbacks: list[Callable[[], Any]] = []
 
     async def connect(self, **kwargs: Any) -> None:
         """Connect to the fake room."""
@@ -255,3 +368,18 @@ class FakeJobContext:
     async def disconnect(self) -> None:
         """Disconnect from the fake room."""
         await self.room.disconnect()
+
+    def add_shutdown_callback(self, callback: Callable[[], Any]) -> None:
+        """Register a callback to run when the session ends."""
+        self._shutdown_callbacks.append(callback)
+
+    async def run_shutdown_callbacks(self) -> None:
+        """Run registered shutdown callbacks, logging (not raising) their failures."""
+        for callback in self._shutdown_callbacks:
+            try:
+                result = callback()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Error in shutdown callback: {e}")
+        self._shutdown_callbacks.clear()
@@ -1,12 +1,56 @@
 """Monkey-patching for LiveKit SDK compatibility."""
 
 import logging
+import weakref
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 # Global flag to prevent multiple patch applications
 _PATCHING_APPLIED = False
+_TOOL_SCHEMA_CACHE_APPLIED = False
+
+
+def patch_tool_schema_cache() -> None:
+    """
+    Memoize the pydantic argument model livekit builds for each function tool.
+
+    livekit-agents rebuilds the model (signature + docstring parsing + pydantic
+    create_model) for every tool on every LLM request and again when validating
+    tool-call arguments. The model only depends on the decorated function, so it
+    is built once per function and reused across agent instances and turns.
+    """
+    global _TOOL_SCHEMA_CACHE_APPLIED
+    if _TOOL_SCHEMA_CACHE_APPLIED:
+        return
+
+    try:
+        from livekit.agents.llm import utils as llm_utils
+    except ImportError:
+        logger.warning("LiveKit SDK not installed, skipping tool schema cache")
+        _TOOL_SCHEMA_CACHE_APPLIED = True
+        return
+
+    original_builder = llm_utils.function_arguments_to_pydantic_model
+    # Bound tools drop the leading `self` parameter, so they get their own cache entry
+    bound_models: weakref.WeakKeyDictionary[Any, Any] = weakref.WeakKeyDictionary()
+    unbound_models: weakref.WeakKeyDictionary[Any, Any] = weakref.WeakKeyDictionary()
+
+    def cached_builder(func: Any) -> Any:
+        target = getattr(func, "_func", None)
+        if target is None:
+            return original_builder(func)
+
+        cache = unbound_models if getattr(func, "_instance", None) is None else bound_models
+        model = cache.get(target)
+        if model is None:
+            model = original_builder(func)
+            cache[target] = model
+        return model
+
+    llm_utils.function_arguments_to_pydantic_model = cached_builder
+    _TOOL_SCHEMA_CACHE_APPLIED = True
+    logger.debug("Function tool schema cache installed")
 
 
 def patch_livekit() -> None:
@@ -23,6 +67,8 @@ def patch_livekit() -> None:
         logger.debug("LiveKit SDK already patched, skipping")
         return
 
+    patch_tool_schema_cache()
+
     try:
         from livekit import agents
 
@@ -34,6 +80,9 @@ def patch_livekit() -> None:
             Wrapper around AgentSession that forces text-only mode.
             """
 
+            # Speech-related events that would trigger TTS
+            _SKIP_EVENTS = frozenset({"speech_created", "speech_started", "speech_done"})
+
             def __init__(self, *args: Any, **kwargs: Any):
                 # Remove/ignore STT and TTS
                 kwargs.pop("stt", None)
@@ -57,8 +106,8 @@ def patch_livekit() -> None:
                 Override emit to skip TTS-related events in text-only mode.
                 """
                 # Skip speech-related events that would trigger TTS
-                if event_name in ('speech_created', 'speech_started', 'speech_done'):
-                    logger.debug(f"Skipping TTS event in text-only mode: {event_name}")
+                if event_name in self._SKIP_EVENTS:
+                    logger.debug("Skipping TTS event in text-only mode: %s", event_name)
                     return None
 
                 return super().emit(event_name, *args, **kwargs)
@@ -8,9 +8,11 @@ in a text-only, stateless mode.
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import logging
+import os
 import time
-import traceback
+from collections import defaultdict
 from collections.abc import Callable
 from typing import Any
 
@@ -27,6 +29,52 @@ except ImportError:
     AGENT_SESSION_AVAILABLE = False
     logger.debug("AgentSession not available - voice agents will not work")
 
+# uvloop speeds up task scheduling, but installing a loop policy is process
+# wide, so it is only done when explicitly requested
+if os.getenv("LIVETXT_USE_UVLOOP") == "1":
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        logger.warning("LIVETXT_USE_UVLOOP is set but uvloop is not installed")
+
+# Longest time the user message waits for the agent to register a
+# data_received handler before it is injected regardless
+HANDLER_WAIT = 0.3
+
+# Longest time to wait for the agent to respond after the entrypoint returns
+RESPONSE_WAIT = 1.0
+
+
+def _user_inputs(request: JobRequest) -> list[str]:
+    """All messages the job should deliver to the agent, in order."""
+    if request.user_inputs:
+        return [request.user_input, *request.user_inputs]
+    return [request.user_input]
+
+
+class _TextRoomInfo:
+    """Room info exposed as ``ctx.job.room``."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+
+class _TextJob:
+    """Job description exposed as ``ctx.job``."""
+
+    __slots__ = ("id", "type", "room", "agent_name", "metadata")
+
+    def __init__(self, job_id: str):
+        self.id = job_id
+        self.type = "room"
+        self.room = _TextRoomInfo(f"session_{job_id}")
+        self.agent_name = "text-agent"
+        self.metadata = "{}"
+
 
 class TextOnlyJobContext:
     """
@@ -40,19 +88,11 @@ class TextOnlyJobContext:
         self.request = request
         self._output_buffer = output_buffer
         self._connected = False
+        self._shutdown_callbacks: list[Callable[[], Any]] = []
+        self._inject_task: asyncio.Task | None = None
 
         # Create fake job object
-        self.job = type(
-            "Job",
-            (),
-            {
-                "id": request.job_id,
-                "type": "room",
-                "room": type("RoomInfo", (), {"name": f"session_{request.job_id}"})(),
-                "agent_name": "text-agent",
-                "metadata": "{}",
-            },
-        )()
+        self.job = _TextJob(request.job_id)
 
         # Create fake room
         self.room = TextOnlyRoom(request, output_buffer)
@@ -66,44 +106,90 @@ class TextOnlyJobContext:
             return
 
         self._connected = True
-        logger.debug(f"[Job {self.request.job_id}] Agent connected")
+        logger.debug("[Job %s] Agent connected", self.request.job_id)
 
         # Schedule message injection for after handlers are set up
-        asyncio.create_task(self._inject_user_message())
+        self._inject_task = asyncio.create_task(self._inject_user_message())
+
+    def add_shutdown_callback(self, callback: Callable[[], Any]) -> None:
+        """Register a callback to run once the job finishes (mirrors JobContext)."""
+        self._shutdown_callbacks.append(callback)
+
+    async def run_shutdown_callbacks(self) -> None:
+        """Run registered shutdown callbacks, logging (not raising) their failures."""
+        for callback in self._shutdown_callbacks:
+            try:
+                result = callback()
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error("Error in shutdown callback: %s", e)
+        self._shutdown_callbacks.clear()
+
+    async def wait_for_response(self, timeout: float) -> None:
+        """
+        Wait until the injected message has been handled and the agent responded.
+
+        Returns early once both have happened; otherwise gives up quietly after
+        ``timeout`` seconds, leaving whatever output was captured so far.
+        """
+        response = asyncio.ensure_future(self.room._response_ready.wait())
+        waiters = {response}
+        if self._inject_task:
+            waiters.add(self._inject_task)
+
+        # One timer for both; unlike wait_for, a timeout leaves the injection running
+        _, pending = await asyncio.wait(waiters, timeout=timeout)
+        response.cancel()
+        if pending:
+            logger.debug("[Job %s] No response after %ss", self.request.job_id, timeout)
 
     async def _inject_user_message(self) -> None:
         """Inject the user's input as a data_received event."""
-        # Wait a bit longer for agent to fully set up handlers
-        await asyncio.sleep(0.3)
+        # Give agent time to set up handlers, but no longer than it needs
+        try:
+            await asyncio.wait_for(self.room._handlers_ready.wait(), timeout=HANDLER_WAIT)
+        except asyncio.TimeoutError:
+            logger.debug("No data_received handler after %ss, injecting anyway", HANDLER_WAIT)
 
-        # Emit data_received event with the user's message
-        data = self.request.user_input.encode("utf-8")
+        # Emit a data_received event for each of the user's messages
+        messages = [user_input.encode("utf-8") for user_input in _user_inputs(self.request)]
         remote_participant = self.room.remote_participants.get("user")
 
-        logger.debug(
-            f"[Job {self.request.job_id}] Injecting user message: {self.request.user_input}"
-        )
-        logger.debug(
-            f"[Job {self.request.job_id}] Registered handlers: {list(self.room._event_handlers.keys())}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[Job %s] Injecting user messages: %s",
+                self.request.job_id,
+                _user_inputs(self.request),
+            )
+            logger.debug(
+                "[Job %s] Registered handlers: %s",
+                self.request.job_id,
+                list(self.room._event_handlers),
+            )
 
-        if self.room._event_handlers.get("data_received"):
-            for handler in self.room._event_handlers["data_received"]:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        await handler(data, "lk.chat", remote_participant)
-                    else:
-                        handler(data, "lk.chat", remote_participant)
-                    logger.debug(f"[Job {self.request.job_id}] Called data_received handler")
-                except Exception as e:
-                    logger.error(f"Error in data_received handler: {e}")
+        dispatch = self.room._event_dispatch.get("data_received")
+        if dispatch:
+            # Messages are delivered in order, each to every handler in turn
+            for data in messages:
+                for handler, is_async in dispatch:
+                    try:
+                        if is_async:
+                            await handler(data, "lk.chat", remote_participant)
+                        else:
+                            handler(data, "lk.chat", remote_participant)
+                        logger.debug("[Job %s] Called data_received handler", self.request.job_id)
+                    except Exception as e:
+                        logger.error("Error in data_received handler: %s", e)
         else:
-            logger.warning(f"[Job {self.request.job_id}] No data_received handlers registered!")
+            logger.warning("[Job %s] No data_received handlers registered!", self.request.job_id)
 
 
 class FakeParticipant:
     """Minimal fake participant."""
 
+    __slots__ = ("identity", "name", "sid", "metadata", "attributes", "kind", "_publish_override")
+
     def __init__(self, identity: str, name: str):
         self.identity = identity
         self.name = name
@@ -121,35 +207,31 @@ class FakeParticipant:
         without await from synchronous handlers. We make this work by scheduling
         the actual work asynchronously.
         """
-        logger.debug(
-            f"FakeParticipant.publish_data called with {len(data) if isinstance(data, bytes) else 'non-bytes'} bytes"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "FakeParticipant.publish_data called with %s bytes",
+                len(data) if isinstance(data, bytes) else "non-bytes",
+            )
 
-        if self._publish_override:
+        override = self._publish_override
+        if override is None:
+            logger.warning("publish_data called but no override set!")
+        elif not asyncio.iscoroutinefunction(override):
+            # Sync override (the usual case): call it directly, no loop needed
+            override(data, topic=topic, reliable=reliable)
+        else:
             # Schedule the async work
             try:
-                asyncio.get_event_loop()
-                if asyncio.iscoroutinefunction(self._publish_override):
-                    # Create task to run the async override
-                    asyncio.create_task(
-                        self._publish_override(data, topic=topic, reliable=reliable)
-                    )
-                else:
-                    # Call sync override directly
-                    self._publish_override(data, topic=topic, reliable=reliable)
+                loop = asyncio.get_running_loop()
             except RuntimeError:
-                # No event loop, call synchronously if possible
-                if not asyncio.iscoroutinefunction(self._publish_override):
-                    self._publish_override(data, topic=topic, reliable=reliable)
-                else:
-                    logger.error("Cannot schedule async publish_data without event loop")
-        else:
-            logger.warning("publish_data called but no override set!")
+                logger.error("Cannot schedule async publish_data without event loop")
+            else:
+                loop.create_task(override(data, topic=topic, reliable=reliable))
 
     async def set_attributes(self, attributes: dict):
         """Set participant attributes (needed by AgentSession)."""
         self.attributes.update(attributes)
-        logger.debug(f"FakeParticipant.set_attributes: {attributes}")
+        logger.debug("FakeParticipant.set_attributes: %s", attributes)
 
     def get(self, key: str, default=None):
         """Get attribute value."""
@@ -175,7 +257,15 @@ class TextOnlyRoom:
         self.isconnected = lambda: True  # Always report as connected
 
         # Event handlers
-        self._event_handlers: dict[str, list[Callable]] = {}
+        self._event_handlers: dict[str, list[Callable]] = defaultdict(list)
+        # Per event, the handlers paired with whether they are coroutine
+        # functions, so dispatching does not have to inspect each one again
+        self._event_dispatch: dict[str, tuple[tuple[Callable, bool], ...]] = {}
+
+        # Set once the agent listens for data_received, and once it has
+        # produced output, so the job can move on as soon as each happens
+        self._handlers_ready = asyncio.Event()
+        self._response_ready = asyncio.Event()
 
         # Participants
         self.local_participant = FakeParticipant("agent", "Agent")
@@ -205,9 +295,13 @@ class TextOnlyRoom:
 
     def _register_handler(self, event: str, callback: Callable) -> None:
         """Register an event handler."""
-        if event not in self._event_handlers:
-            self._event_handlers[event] = []
         self._event_handlers[event].append(callback)
+        self._event_dispatch[event] = (
+            *self._event_dispatch.get(event, ()),
+            (callback, asyncio.iscoroutinefunction(callback)),
+        )
+        if event == "data_received":
+            self._handlers_ready.set()
 
     def _capture_agent_output(self, data: bytes, *, topic: str = "", reliable: bool = True) -> None:
         """
@@ -220,10 +314,11 @@ class TextOnlyRoom:
         """
         try:
             message = data.decode("utf-8") if isinstance(data, bytes) else str(data)
-            logger.debug(f"[Job {self.request.job_id}] Captured output: {message[:100]}...")
+            logger.debug("[Job %s] Captured output: %.100s...", self.request.job_id, message)
             self._output_buffer.append(message)
+            self._response_ready.set()
         except Exception as e:
-            logger.error(f"Error capturing agent output: {e}")
+            logger.error("Error capturing agent output: %s", e)
 
     # Fake methods that AgentSession might call
     def register_byte_stream_handler(self, *args, **kwargs):
@@ -269,133 +364,118 @@ async def execute_job(
     Returns:
         JobResult with status, response, and updated state
     """
-    start_time = time.time()
+    start_time = time.monotonic()
     timeout = (timeout_ms or request.timeout_ms) / 1000.0  # Convert to seconds
 
     # Buffer to capture agent's text output
     output_buffer: list[str] = []
 
-    # Reference to captured agent (for extracting chat_ctx)
-    captured_agent = None
-    captured_session = None
-
     # Create the fake context
     ctx = TextOnlyJobContext(request, output_buffer)
 
-    # Install AgentSession hooks if available
-    cleanup_hook = None
+    # Per-job capture state; the captured agent is used for extracting chat_ctx
+    hooks = _JobHooks(output_buffer, ctx.room._response_ready)
+
+    # Route AgentSession output for this job (and the tasks it spawns) to hooks
+    hooks_token = None
     if AGENT_SESSION_AVAILABLE:
-        def _set_captured_agent(agent):
-            nonlocal captured_agent
-            captured_agent = agent
-
-        def _set_captured_session(session):
-            nonlocal captured_session
-            captured_session = session
-
-        cleanup_hook = _install_agent_session_hooks(
-            output_buffer,
-            _set_captured_agent,
-            _set_captured_session
-        )
+        _install_agent_session_hooks()
+        hooks_token = _JOB_HOOKS.set(hooks)
 
     async def _execute_with_timeout():
-        # Run the entrypoint with timeout
+        # Run the entrypoint; the timeout is applied once, around this whole function
         if asyncio.iscoroutinefunction(entrypoint):
-            await asyncio.wait_for(entrypoint(ctx), timeout=timeout)
+            await entrypoint(ctx)
         else:
             # Sync function - run in executor
-            await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(None, entrypoint, ctx), timeout=timeout
-            )
+            await asyncio.get_running_loop().run_in_executor(None, entrypoint, ctx)
 
         # For text-based LLMs, use AgentSession.run() to process the message
-        if captured_session and hasattr(captured_session, '_livetxt_use_run_method') and captured_session._livetxt_use_run_method:
+        if hooks.session and hasattr(hooks.session, '_livetxt_use_run_method') and hooks.session._livetxt_use_run_method:
             logger.info("Using AgentSession.run() for text-based LLM")
             try:
                 # Give session a moment to fully start
                 await asyncio.sleep(0.1)
 
-                # Use run() to process the user input
-                result = await captured_session.run(user_input=request.user_input)
-                logger.info(f"AgentSession.run() completed, result type: {type(result)}")
-
-                # Extract response from result
-                if hasattr(result, 'last_message') and result.last_message:
-                    msg = result.last_message
-                    if hasattr(msg, 'content'):
-                        if isinstance(msg.content, str):
-                            logger.info(f"✅ Captured response from run(): {msg.content[:100]}...")
-                            output_buffer.append(msg.content)
-                        elif isinstance(msg.content, list):
-                            for part in msg.content:
-                                if hasattr(part, 'text'):
-                                    logger.info(f"✅ Captured text from content part: {part.text[:100]}...")
-                                    output_buffer.append(part.text)
-                                elif isinstance(part, str):
-                                    output_buffer.append(part)
+                # Use run() to process the user input; one message at a time,
+                # since each turn builds on the chat history of the last
+                for user_input in _user_inputs(request):
+                    result = await hooks.session.run(user_input=user_input)
+                    logger.info("AgentSession.run() completed, result type: %s", type(result))
+
+                    # Extract response from result
+                    if hasattr(result, 'last_message') and result.last_message:
+                        msg = result.last_message
+                        if hasattr(msg, 'content'):
+                            if isinstance(msg.content, str):
+                                logger.info("✅ Captured response from run(): %.100s...", msg.content)
+                                output_buffer.append(msg.content)
+                            elif isinstance(msg.content, list):
+                                for part in msg.content:
+                                    if hasattr(part, 'text'):
+                                        logger.info(
+                                            "✅ Captured text from content part: %.100s...", part.text
+                                        )
+                                        output_buffer.append(part.text)
+                                    elif isinstance(part, str):
+                                        output_buffer.append(part)
             except Exception as e:
-                logger.error(f"Error using AgentSession.run(): {e}")
-                logger.error(traceback.format_exc())
+                logger.error("Error using AgentSession.run(): %s", e, exc_info=True)
         else:
             # Voice-based model or legacy approach: wait for async message injection
             logger.debug("Using voice-based approach with message injection")
-            await asyncio.sleep(1.0)
+            await ctx.wait_for_response(RESPONSE_WAIT)
 
     try:
         # Run the entire execution with timeout
         await asyncio.wait_for(_execute_with_timeout(), timeout=timeout)
 
         # Try to extract response from chat context if we haven't captured it yet
-        if not output_buffer and captured_agent and hasattr(captured_agent, 'chat_ctx'):
+        if not output_buffer and hooks.agent and hasattr(hooks.agent, 'chat_ctx'):
             logger.info("No output captured via hooks, trying to extract from chat_ctx")
             try:
-                chat_ctx = captured_agent.chat_ctx
-                logger.info(f"Agent has chat_ctx: {chat_ctx}")
-                logger.info(f"chat_ctx type: {type(chat_ctx)}")
-                logger.info(f"chat_ctx dir: {[x for x in dir(chat_ctx) if not x.startswith('_')]}")
-
-                # ChatContext uses 'items' not 'messages'
-                if chat_ctx:
-                    items = chat_ctx.items if hasattr(chat_ctx, 'items') else []
-                    logger.info(f"Chat context has {len(items)} items")
-                    for item in items:
-                        logger.info(f"  Item role={getattr(item, 'role', None)}, type={type(item)}")
-                        if hasattr(item, 'role') and item.role == 'assistant' and hasattr(item, 'content'):
-                            # Extract assistant message
-                                content = item.content
-                                logger.info(f"  Assistant content type: {type(content)}")
-                                if isinstance(content, str):
-                                    logger.info(f"✅ Captured assistant message from chat_ctx: {content[:100]}...")
-                                    output_buffer.append(content)
-                                elif isinstance(content, list):
-                                    # Content might be a list of content parts
-                                    for part in content:
-                                        if hasattr(part, 'text'):
-                                            logger.info(f"✅ Captured assistant text from content part: {part.text[:100]}...")
-                                            output_buffer.append(part.text)
-                                        elif isinstance(part, dict) and 'text' in part:
-                                            logger.info(f"✅ Captured assistant text from dict: {part['text'][:100]}...")
-                                            output_buffer.append(part['text'])
-                                else:
-                                    logger.warning(f"⚠️ Assistant content is not string or list: {content}")
+                chat_ctx = hooks.agent.chat_ctx
+
+                # ChatContext uses 'items' not 'messages'. The reply to this
+                # turn is the newest assistant message, so search from the end
+                # rather than walking the whole (restored) history.
+                items = getattr(chat_ctx, 'items', None) or []
+                for item in reversed(items):
+                    if getattr(item, 'role', None) != 'assistant':
+                        continue
+
+                    content = getattr(item, 'content', None)
+                    if isinstance(content, str):
+                        output_buffer.append(content)
+                    elif isinstance(content, list):
+                        # Content might be a list of strings or content parts
+                        for part in content:
+                            if isinstance(part, str):
+                                output_buffer.append(part)
+                            elif hasattr(part, 'text'):
+                                output_buffer.append(part.text)
+                            elif isinstance(part, dict) and 'text' in part:
+                                output_buffer.append(part['text'])
+                    else:
+                        logger.warning("⚠️ Assistant content is not string or list: %r", content)
+                    logger.debug("Captured %d text parts from chat_ctx", len(output_buffer))
+                    break
             except Exception as e:
-                logger.error(f"Error extracting from chat_ctx: {e}")
-                logger.error(traceback.format_exc())
+                logger.error("Error extracting from chat_ctx: %s", e, exc_info=True)
 
         # Collect the response
         response_text = " ".join(output_buffer) if output_buffer else None
         logger.debug(
-            f"[Job {request.job_id}] Captured {len(output_buffer)} messages: {output_buffer}"
+            "[Job %s] Captured %d messages: %s", request.job_id, len(output_buffer), output_buffer
         )
 
         # Extract updated state from agent if available
-        if captured_agent and hasattr(captured_agent, "_chat_ctx"):
-            logger.debug(f"[Job {request.job_id}] Extracting state from agent's chat_ctx")
+        if hooks.agent and hasattr(hooks.agent, "_chat_ctx"):
+            logger.debug("[Job %s] Extracting state from agent's chat_ctx", request.job_id)
             try:
-                updated_state = SerializableSessionState.from_chat_context(captured_agent._chat_ctx)
+                updated_state = SerializableSessionState.from_chat_context(hooks.agent._chat_ctx)
             except Exception as e:
-                logger.warning(f"Failed to extract chat context: {e}")
+                logger.warning("Failed to extract chat context: %s", e)
                 updated_state = request.state
         else:
             # For simple agents without AgentSession, just track metadata
@@ -407,8 +487,11 @@ async def execute_job(
                 "agent_response": response_text,
                 "timestamp": time.time(),
             }
+            if request.user_inputs:
+                # Batched messages handled after user_input in this turn
+                updated_state.metadata["last_turn"]["user_inputs"] = request.user_inputs
 
-        processing_time_ms = (time.time() - start_time) * 1000
+        processing_time_ms = (time.monotonic() - start_time) * 1000
 
         return JobResult(
             job_id=request.job_id,
@@ -419,21 +502,21 @@ async def execute_job(
         )
 
     except asyncio.TimeoutError:
-        processing_time_ms = (time.time() - start_time) * 1000
-        logger.warning(f"Job {request.job_id} timed out after {processing_time_ms}ms")
+        processing_time_ms = (time.monotonic() - start_time) * 1000
+        logger.warning("Job %s timed out after %.0fms", request.job_id, processing_time_ms)
 
         return JobResult(
             job_id=request.job_id,
             status="timeout",
-            error=f"Job execution exceeded timeout of {timeout_ms}ms",
+            error=f"Job execution exceeded timeout of {timeout * 1000:.0f}ms",
             processing_time_ms=processing_time_ms,
         )
 
     except Exception as e:
-        processing_time_ms = (time.time() - start_time) * 1000
+        processing_time_ms = (time.monotonic() - start_time) * 1000
         error_details = f"{type(e).__name__}: {str(e)}"
-        logger.error(f"Job {request.job_id} failed: {error_details}")
-        logger.debug(traceback.format_exc())
+        logger.error("Job %s failed: %s", request.job_id, error_details)
+        logger.debug("Job %s traceback", request.job_id, exc_info=True)
 
         return JobResult(
             job_id=request.job_id,
@@ -443,49 +526,66 @@ async def execute_job(
         )
 
     finally:
-        # Cleanup hooks
-        if cleanup_hook:
-            cleanup_hook()
+        if hooks_token:
+            _JOB_HOOKS.reset(hooks_token)
+
+        await ctx.run_shutdown_callbacks()
+
+
+class _JobHooks:
+    """Capture state for the job whose AgentSession is being started."""
+
+    __slots__ = ("output_buffer", "response_ready", "agent", "session")
+
+    def __init__(self, output_buffer: list[str], response_ready: asyncio.Event):
+        self.output_buffer = output_buffer
+        self.response_ready = response_ready
+        self.agent: Any = None
+        self.session: Any = None
+
+
+# Set by execute_job for the duration of a job; sessions started outside a job
+# see None and run unpatched
+_JOB_HOOKS: contextvars.ContextVar[_JobHooks | None] = contextvars.ContextVar(
+    "livetxt_job_hooks", default=None
+)
 
+_hooks_installed = False
 
-def _install_agent_session_hooks(
-    output_buffer: list[str],
-    on_agent_captured: Callable,
-    on_session_captured: Callable
-) -> Callable:
+
+def _install_agent_session_hooks() -> None:
     """
     Install hooks into AgentSession to capture LLM responses.
 
-    This patches AgentSession.start() to:
+    This patches AgentSession.start() once per process. For sessions started
+    inside execute_job, the patched method uses the job's _JOB_HOOKS entry to:
     1. Hook into conversation events
     2. Capture assistant messages from the LLM
     3. Extract the agent instance for state capture
     4. Capture the session instance for text-based processing
-
-    Args:
-        output_buffer: List to append captured messages to
-        on_agent_captured: Callback when agent is captured
-        on_session_captured: Callback when session is captured
-
-    Returns:
-        Cleanup function to restore original AgentSession.start
     """
-    if not AGENT_SESSION_AVAILABLE:
-        return lambda: None
+    global _hooks_installed
+    if _hooks_installed or not AGENT_SESSION_AVAILABLE:
+        return
 
     original_start = AgentSession.start
 
     async def patched_start(self, *args, **kwargs):
         """Patched start method that hooks into conversation events."""
+        hooks = _JOB_HOOKS.get()
+        if hooks is None:
+            return await original_start(self, *args, **kwargs)
+        output_buffer = hooks.output_buffer
+
         # Capture the session reference
-        on_session_captured(self)
+        hooks.session = self
 
         # Extract agent from args/kwargs
         agent = kwargs.get("agent") if "agent" in kwargs else (args[0] if args else None)
 
         if agent:
             # Capture the agent reference
-            on_agent_captured(agent)
+            hooks.agent = agent
 
             # Replace RealtimeModel with text-based LLM for text-only mode
             is_text_based_llm = False
@@ -495,8 +595,9 @@ def _install_agent_session_hooks(
                 # Check if it's a RealtimeModel (voice-based)
                 if 'realtime' in llm_type.lower() or 'RealtimeModel' in llm_type:
                     logger.warning(
-                        f"Agent uses {llm_type} which requires audio. "
-                        "Replacing with text-based LLM (gpt-5-mini) for text-only mode."
+                        "Agent uses %s which requires audio. "
+                        "Replacing with text-based LLM (gpt-5-mini) for text-only mode.",
+                        llm_type,
                     )
                     try:
                         from livekit.plugins import openai
@@ -505,7 +606,7 @@ def _install_agent_session_hooks(
                         is_text_based_llm = True
                         logger.info("Successfully replaced RealtimeModel with text-based LLM")
                     except Exception as e:
-                        logger.error(f"Failed to replace RealtimeModel: {e}")
+                        logger.error("Failed to replace RealtimeModel: %s", e)
                         logger.error("Agent may not respond correctly in text-only mode")
                 else:
                     # Already a text-based LLM
@@ -523,7 +624,7 @@ def _install_agent_session_hooks(
             def debug_emit(event_name, *args, **kwargs):
                 # Only log important events, not all events
                 if event_name in ('agent_state_changed', 'conversation_item_added'):
-                    logger.debug(f"AgentSession: {event_name}")
+                    logger.debug("AgentSession: %s", event_name)
                 return original_emit(event_name, *args, **kwargs)
             self.emit = debug_emit
 
@@ -538,21 +639,23 @@ def _install_agent_session_hooks(
                     # Extract text content from the message
                     if hasattr(item, "text_content") and item.text_content:
                         text = item.text_content
-                        logger.info(f"✅ Captured assistant message: {text[:100]}...")
+                        logger.info("✅ Captured assistant message: %.100s...", text)
                         output_buffer.append(text)
                     elif hasattr(item, "content") and isinstance(item.content, str):
-                        logger.info(f"✅ Captured assistant content: {item.content[:100]}...")
+                        logger.info("✅ Captured assistant content: %.100s...", item.content)
                         output_buffer.append(item.content)
                     else:
                         logger.warning("Assistant item has no extractable text content")
+                        return
+                    hooks.response_ready.set()
             except Exception as e:
-                logger.error(f"Error in conversation_item_added handler: {e}")
+                logger.error("Error in conversation_item_added handler: %s", e)
 
         # Hook into say() method as alternative capture mechanism
         if hasattr(self, 'say'):
             original_say = self.say
             async def patched_say(text: str, *args, **kwargs):
-                logger.info(f"✅ Agent said: {text[:100]}...")
+                logger.info("✅ Agent said: %.100s...", text)
                 output_buffer.append(text)
                 return await original_say(text, *args, **kwargs)
             self.say = patched_say
@@ -563,10 +666,4 @@ def _install_agent_session_hooks(
 
     # Install the patch
     AgentSession.start = patched_start
-
-    # Return cleanup function
-    def cleanup():
-        AgentSession.start = original_start
-        logger.debug("AgentSession: Hooks cleaned up")
-
-    return cleanup
+    _hooks_installed = True
@@ -44,6 +44,74 @@ class TestSimpleEchoAgent:
         assert result.response_text == "Echo: Hello!"
         assert result.updated_state is not None
 
+    @pytest.mark.anyio
+    async def test_job_finishes_once_agent_responds(self):
+        """Test that a responsive agent is not held back by the response wait."""
+        from livetxt.worker import RESPONSE_WAIT
+
+        async def echo_agent(ctx):
+            await ctx.connect()
+            ctx.room.on(
+                "data_received",
+                lambda data, topic, participant: ctx.room.local_participant.publish_data(data),
+            )
+
+        request = JobRequest(job_id="test_fast", user_input="ping", state=SerializableSessionState())
+
+        result = await execute_job(echo_agent, request)
+
+        assert result.response_text == "ping"
+        assert result.processing_time_ms < RESPONSE_WAIT * 1000 / 2
+
+    @pytest.mark.anyio
+    async def test_batched_inputs_delivered_in_order(self):
+        """Test that extra user_inputs are handled in the same job, after user_input."""
+        async def echo_agent(ctx):
+            await ctx.connect()
+            ctx.room.on(
+                "data_received",
+                lambda data, topic, participant: ctx.room.local_participant.publish_data(data),
+            )
+
+        request = JobRequest(
+            job_id="test_batch",
+            user_input="one",
+            user_inputs=["two", "three"],
+            state=SerializableSessionState(),
+        )
+
+        result = await execute_job(echo_agent, request)
+
+        assert result.response_text == "one two three"
+        last_turn = result.updated_state.metadata["last_turn"]
+        assert last_turn["user_input"] == "one"
+        assert last_turn["user_inputs"] == ["two", "three"]
+
+    @pytest.mark.anyio
+    async def test_shutdown_callbacks_run_after_job(self):
+        """Test that callbacks registered via add_shutdown_callback run when the job ends."""
+        from livekit.agents import JobContext
+
+        calls = []
+
+        async def close_resources():
+            calls.append("closed")
+
+        async def agent_with_cleanup(ctx: JobContext):
+            ctx.add_shutdown_callback(close_resources)
+            await ctx.connect()
+
+        request = JobRequest(
+            job_id="test_shutdown",
+            user_input="Hello!",
+            state=SerializableSessionState()
+        )
+
+        result = await execute_job(agent_with_cleanup, request)
+
+        assert result.status == "success"
+        assert calls == ["closed"]
+
 
 class TestVoiceAgentInTextMode:
     """Test that voice agents can work in text mode."""
@@ -183,3 +251,126 @@ class TestErrorHandling:
         
         assert result.status == "timeout"
 
+
+
+class TestLiveTxtWorkerSessions:
+    """Test session bookkeeping in the gateway-connected worker."""
+
+    @pytest.mark.anyio
+    async def test_oldest_session_evicted_over_limit(self):
+        """Test that the least recently active session is dropped at capacity."""
+        from livetxt.config import LiveTxtConfig
+        from livetxt.runtime import LiveTxtWorker
+
+        release = asyncio.Event()
+
+        async def waiting_agent(ctx):
+            await release.wait()
+
+        config = LiveTxtConfig(gateway_url="http://localhost", api_key="test", max_sessions=1)
+        worker = LiveTxtWorker(config, waiting_agent)
+
+        await worker._handle_message({"session_id": "s1", "from": "+1", "message": "hi"})
+        await asyncio.sleep(0)
+        await worker._handle_message({"session_id": "s2", "from": "+2", "message": "hi"})
+        await asyncio.sleep(0)
+
+        assert list(worker._active_sessions) == ["s2"]
+
+        release.set()
+        # The evicted session's task is cancelled, so collect rather than raise
+        await asyncio.gather(*worker._session_tasks, return_exceptions=True)
+        assert not worker._active_sessions
+
+    @pytest.mark.anyio
+    async def test_evicted_session_entrypoint_cancelled(self):
+        """Test that eviction stops the entrypoint and runs its shutdown callbacks."""
+        from livetxt.config import LiveTxtConfig
+        from livetxt.runtime import LiveTxtWorker
+
+        closed = []
+
+        async def waiting_agent(ctx):
+            ctx.add_shutdown_callback(lambda: closed.append(ctx.room.name))
+            await asyncio.Event().wait()
+
+        config = LiveTxtConfig(gateway_url="http://localhost", api_key="test", max_sessions=1)
+        worker = LiveTxtWorker(config, waiting_agent)
+
+        await worker._handle_message({"session_id": "s1", "from": "+1", "message": "hi"})
+        await asyncio.sleep(0)
+        first_task = worker._active_sessions["s1"][2]
+
+        await worker._handle_message({"session_id": "s2", "from": "+2", "message": "hi"})
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert first_task.cancelled()
+        assert len(closed) == 1
+        assert list(worker._active_sessions) == ["s2"]
+
+        for task in list(worker._session_tasks):
+            task.cancel()
+        await asyncio.gather(*worker._session_tasks, return_exceptions=True)
+
+    @pytest.mark.anyio
+    async def test_sessions_run_concurrently_up_to_limit(self):
+        """Test that a slow entrypoint does not block other sessions beyond the cap."""
+        from livetxt.config import LiveTxtConfig
+        from livetxt.runtime import LiveTxtWorker
+
+        release = asyncio.Event()
+        running = []
+
+        async def waiting_agent(ctx):
+            running.append(ctx.room.name)
+            await release.wait()
+
+        config = LiveTxtConfig(
+            gateway_url="http://localhost", api_key="test", max_concurrent_sessions=2
+        )
+        worker = LiveTxtWorker(config, waiting_agent)
+
+        for i in range(3):
+            await worker._handle_message({"session_id": f"s{i}", "from": "+1", "message": "hi"})
+        await asyncio.sleep(0)
+
+        assert len(running) == 2
+        assert len(worker._active_sessions) == 3
+
+        release.set()
+        await asyncio.gather(*list(worker._session_tasks))
+        assert len(running) == 3
+        assert not worker._session_tasks
+
+    @pytest.mark.anyio
+    async def test_stop_flushes_rooms_and_awaits_sessions(self):
+        """Test that stopping sends buffered replies and runs shutdown callbacks."""
+        from livetxt.config import LiveTxtConfig
+        from livetxt.runtime import LiveTxtWorker
+
+        sent = []
+        closed = []
+
+        class RecordingClient:
+            async def send_response(self, session_id, message):
+                sent.append((session_id, message))
+
+        async def buffering_agent(ctx):
+            ctx.add_shutdown_callback(lambda: closed.append(sent[:]))
+            await ctx.room.local_participant.publish_data(b"bye")
+            await asyncio.Event().wait()
+
+        config = LiveTxtConfig(gateway_url="http://localhost", api_key="test", send_debounce=60)
+        worker = LiveTxtWorker(config, buffering_agent)
+        worker.client = RecordingClient()
+
+        await worker._handle_message({"session_id": "s1", "from": "+1", "message": "hi"})
+        await asyncio.sleep(0)
+        assert sent == []
+
+        await worker._stop_sessions()
+
+        assert sent == [("s1", "bye")]
+        assert closed == [[("s1", "bye")]]
+        assert not worker._session_tasks
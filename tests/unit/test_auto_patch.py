@@ -0,0 +1,193 @@
+"""
+Unit tests for automatic state capture.
+"""
+
+import asyncio
+import gc
+from unittest.mock import patch
+
+import pytest
+from livekit.agents import Agent, function_tool
+
+from livetxt.serialization import serialize_chat_context
+from livetxt.shim import auto_patch
+from livetxt.shim.auto_patch import (
+    clear_agent_state,
+    editable_chat_ctx,
+    get_agent_state,
+    install_agent_hooks,
+    patch_livekit_auto,
+    set_execution_context,
+)
+
+
+class TestLazyCapture:
+    """Test that chat context serialization is deferred to get_agent_state()."""
+
+    def test_reads_do_not_serialize(self):
+        """Test that reading chat_ctx only serializes once, when state is requested."""
+        patch_livekit_auto()
+        agent = Agent(instructions="You are a test agent.")
+        editable_chat_ctx(agent).add_message(role="user", content="hello")
+
+        try:
+            with patch(
+                "livetxt.serialization.serialize_chat_context", wraps=serialize_chat_context
+            ) as serialize:
+                for _ in range(5):
+                    _ = agent.chat_ctx
+                assert serialize.call_count == 0
+
+                state = get_agent_state(agent)
+                assert state["chat_context"]["items"][0]["content"] == ["hello"]
+                assert serialize.call_count == 1
+
+                # Unchanged since the last capture, so the snapshot is reused
+                assert get_agent_state(agent) is state
+                assert serialize.call_count == 1
+
+                # Read again but not modified: still no recapture
+                _ = agent.chat_ctx
+                assert get_agent_state(agent) is state
+                assert serialize.call_count == 1
+        finally:
+            clear_agent_state(agent)
+
+    def test_only_new_items_serialized(self):
+        """Test that a capture after appending serializes just the appended items."""
+        patch_livekit_auto()
+        agent = Agent(instructions="You are a test agent.")
+        chat_ctx = editable_chat_ctx(agent)
+        chat_ctx.add_message(role="user", content="hello")
+        chat_ctx.add_message(role="assistant", content="hi")
+
+        try:
+            _ = agent.chat_ctx
+            first = get_agent_state(agent)["chat_context"]["items"]
+
+            chat_ctx.add_message(role="user", content="again")
+            _ = agent.chat_ctx
+            with patch(
+                "livetxt.serialization.serialize_chat_context", wraps=serialize_chat_context
+            ) as serialize:
+                items = get_agent_state(agent)["chat_context"]["items"]
+
+            assert [item["content"] for item in items] == [["hello"], ["hi"], ["again"]]
+            assert items[:2] == first
+            assert len(serialize.call_args.args[0].items) == 1
+        finally:
+            clear_agent_state(agent)
+
+    def test_agent_without_hooks_captured(self):
+        """Test that an agent that never got install_agent_hooks can still be captured."""
+        patch_livekit_auto()
+        agent = Agent(instructions="You are a test agent.")
+        del agent._livetxt_function_calls
+        editable_chat_ctx(agent).add_message(role="user", content="hello")
+
+        try:
+            _ = agent.chat_ctx
+            state = get_agent_state(agent)
+        finally:
+            clear_agent_state(agent)
+
+        assert state["function_calls"] == []
+        assert state["chat_context"]["items"][0]["content"] == ["hello"]
+
+    def test_never_read_returns_empty_state(self):
+        """Test that an agent whose chat_ctx was never read has no chat context."""
+        patch_livekit_auto()
+        agent = Agent(instructions="You are a test agent.")
+
+        assert get_agent_state(agent)["chat_context"] is None
+
+
+class TestFunctionToolTracking:
+    """Test wrapping of an agent's function tools."""
+
+    def test_each_tool_wrapped_separately(self):
+        """Test that every tool wrapper calls and records its own tool."""
+        class ToolAgent(Agent):
+            def __init__(self) -> None:
+                super().__init__(instructions="You are a test agent.")
+
+            @function_tool
+            async def first_tool(self) -> str:
+                """Return the first value."""
+                return "first"
+
+            @function_tool
+            async def second_tool(self) -> str:
+                """Return the second value."""
+                return "second"
+
+        agent = ToolAgent()
+        install_agent_hooks(agent)
+
+        assert asyncio.run(agent.first_tool()) == "first"
+        assert asyncio.run(agent.second_tool()) == "second"
+        assert [call["function_name"] for call in agent._livetxt_function_calls] == [
+            "first_tool",
+            "second_tool",
+        ]
+
+    def test_state_released_with_agent(self):
+        """Test that capture records do not outlive their agent."""
+        patch_livekit_auto()
+        agent = Agent(instructions="You are a test agent.")
+        _ = agent.chat_ctx
+        assert agent in auto_patch._AGENT_STATES
+
+        before = len(auto_patch._AGENT_STATES)
+        del agent
+        gc.collect()
+        assert len(auto_patch._AGENT_STATES) == before - 1
+
+
+class TestAutoRestore:
+    """Test restoring previous state into newly created agents."""
+
+    def test_new_agent_restored_from_execution_context(self):
+        """Test that a fresh agent picks up the previous chat and function calls."""
+        patch_livekit_auto()
+        calls = [{"function_name": "lookup", "arguments": {}, "result": "ok", "error": None}]
+        previous_state = {
+            "chat_context": {
+                "items": [{"id": "item_1", "type": "message", "role": "user", "content": ["hi"]}]
+            },
+            "function_calls": calls,
+        }
+        set_execution_context({"previous_state": previous_state})
+
+        try:
+            agent = Agent(instructions="You are a test agent.")
+        finally:
+            set_execution_context({})
+
+        assert [item.text_content for item in agent.chat_ctx.items] == ["hi"]
+        assert agent._livetxt_function_calls is calls
+        assert "function_calls" not in previous_state
+
+    @pytest.mark.anyio
+    async def test_execution_context_isolated_per_task(self):
+        """Test that concurrent tasks each restore from their own previous state."""
+        patch_livekit_auto()
+
+        async def create_agent(message: str) -> Agent:
+            set_execution_context({
+                "previous_state": {
+                    "chat_context": {
+                        "items": [
+                            {"id": "item_1", "type": "message", "role": "user", "content": [message]}
+                        ]
+                    }
+                }
+            })
+            # Let the other task set its context before this agent is built
+            await asyncio.sleep(0)
+            return Agent(instructions="You are a test agent.")
+
+        first, second = await asyncio.gather(create_agent("one"), create_agent("two"))
+
+        assert first.chat_ctx.items[0].text_content == "one"
+        assert second.chat_ctx.items[0].text_content == "two"
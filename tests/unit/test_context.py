@@ -0,0 +1,95 @@
+"""
+Unit tests for the fake LiveKit room used in SMS mode.
+"""
+
+import asyncio
+
+import pytest
+
+from livetxt.shim.context import INITIAL_MESSAGE_WAIT, FakeRoom
+
+
+class RecordingClient:
+    """Gateway client stand-in that records outgoing responses."""
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, str]] = []
+
+    async def send_response(self, session_id: str, message: str) -> None:
+        self.sent.append((session_id, message))
+
+
+class TestFakeRoomEvents:
+    """Test event handler registration and dispatch."""
+
+    @pytest.mark.anyio
+    async def test_handlers_run_in_registration_order(self):
+        """Test that sync and async handlers run in the order they were added."""
+        room = FakeRoom("s1", "+1", RecordingClient())
+        calls = []
+
+        @room.on("data_received")
+        def sync_handler(data, topic, participant):
+            calls.append(("sync", data))
+
+        @room.on("data_received")
+        async def async_handler(data, topic, participant):
+            calls.append(("async", data))
+
+        await room.handle_incoming_message("hi")
+        assert calls == [("sync", b"hi"), ("async", b"hi")]
+
+        room.off("data_received", sync_handler)
+        await room.handle_incoming_message("again")
+        assert calls[-1] == ("async", b"again")
+        assert len(calls) == 3
+
+    @pytest.mark.anyio
+    async def test_initial_message_waits_only_for_handler(self):
+        """Test that the initial message is delivered as soon as a handler registers."""
+        room = FakeRoom("s1", "+1", RecordingClient(), initial_message="hello")
+        received = asyncio.Event()
+
+        await room.connect()
+        room.on("data_received", lambda data, topic, participant: received.set())
+
+        await asyncio.wait_for(received.wait(), timeout=INITIAL_MESSAGE_WAIT / 5)
+
+
+class TestFakeRoomSend:
+    """Test routing of agent responses to the gateway."""
+
+    @pytest.mark.anyio
+    async def test_responses_sent_immediately_by_default(self):
+        """Test that each published message is sent on its own without debounce."""
+        client = RecordingClient()
+        room = FakeRoom("s1", "+1", client)
+
+        await room.local_participant.publish_data(b"Hello ")
+        await room.local_participant.publish_data(b"there")
+
+        assert client.sent == [("s1", "Hello "), ("s1", "there")]
+
+    @pytest.mark.anyio
+    async def test_fragments_coalesced_within_debounce(self):
+        """Test that fragments inside the debounce window become one message."""
+        client = RecordingClient()
+        room = FakeRoom("s1", "+1", client, send_debounce=0.01)
+
+        await room.local_participant.publish_data(b"Hello ")
+        await room.local_participant.publish_data(b"there")
+        assert client.sent == []
+
+        await asyncio.sleep(0.05)
+        assert client.sent == [("s1", "Hello there")]
+
+    @pytest.mark.anyio
+    async def test_disconnect_flushes_buffer(self):
+        """Test that buffered fragments are sent when the room disconnects."""
+        client = RecordingClient()
+        room = FakeRoom("s1", "+1", client, send_debounce=60)
+
+        await room.local_participant.publish_data(b"bye")
+        await room.disconnect()
+
+        assert client.sent == [("s1", "bye")]
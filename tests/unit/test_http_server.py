@@ -0,0 +1,149 @@
+"""
+Unit tests for the worker HTTP server.
+"""
+
+import json
+
+from fastapi.testclient import TestClient
+
+from livetxt.http_server import create_app
+from livetxt.loader import load_agent_from_file
+
+AGENT_SOURCE = '''
+from livekit.agents import Agent
+
+
+class EchoStream:
+    def __init__(self, text: str) -> None:
+        self._text = text
+
+    async def to_str_iterable(self):
+        yield self._text
+
+
+class EchoLLM:
+    def chat(self, *, chat_ctx):
+        return EchoStream(f"Echo: {chat_ctx.items[-1].text_content}")
+
+
+class EchoAgent(Agent):
+    created = 0
+
+    def __init__(self) -> None:
+        super().__init__(instructions="You are a test agent.", llm=EchoLLM())
+        type(self).created += 1
+'''
+
+POOLABLE_AGENT_SOURCE = AGENT_SOURCE + '''
+
+EchoAgent.livetxt_poolable = True
+'''
+
+
+def _execute(client: TestClient, user_id: str, message: str, agent_state=None) -> dict:
+    response = client.post(
+        "/execute",
+        json={
+            "request_id": f"req-{message}",
+            "session_id": f"session-{user_id}",
+            "user_id": user_id,
+            "message": message,
+            "agent_state": agent_state,
+        },
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestAgentPool:
+    """Test reuse of agent instances across /execute calls."""
+
+    def test_agent_reused_for_same_user(self, tmp_path):
+        """Test that a follow-up request reuses the user's agent and its state."""
+        agent_file = tmp_path / "pooled_agent.py"
+        agent_file.write_text(POOLABLE_AGENT_SOURCE)
+
+        with TestClient(create_app(agent_file=str(agent_file))) as client:
+            first = _execute(client, "user-1", "hello")
+            assert first["status"] == "success"
+
+            second = _execute(client, "user-1", "again", first["updated_state"])
+            assert second["status"] == "success"
+            assert second["response"] == "Echo: again"
+
+            items = second["updated_state"]["chat_context"]["items"]
+            assert [item["content"] for item in items] == [
+                ["hello"],
+                ["Echo: hello"],
+                ["again"],
+                ["Echo: again"],
+            ]
+
+            _execute(client, "user-2", "hi")
+
+        assert load_agent_from_file(agent_file).created == 2
+
+    def test_agents_not_pooled_without_opt_in(self, tmp_path):
+        """Test that agent classes without livetxt_poolable get a fresh agent each turn."""
+        agent_file = tmp_path / "unpooled_agent.py"
+        agent_file.write_text(AGENT_SOURCE)
+
+        with TestClient(create_app(agent_file=str(agent_file))) as client:
+            first = _execute(client, "user-1", "hello")
+            second = _execute(client, "user-1", "again", first["updated_state"])
+
+        assert second["response"] == "Echo: again"
+        assert len(second["updated_state"]["chat_context"]["items"]) == 4
+        assert load_agent_from_file(agent_file).created == 2
+
+    def test_state_restored_into_new_agent(self, tmp_path):
+        """Test that previous state reaches a freshly created agent on a pool miss."""
+        agent_file = tmp_path / "fresh_agent.py"
+        agent_file.write_text(AGENT_SOURCE)
+
+        with TestClient(create_app(agent_file=str(agent_file))) as client:
+            first = _execute(client, "user-1", "hello")
+
+            # A different user has no pooled agent, so a new one is created
+            second = _execute(client, "user-2", "again", first["updated_state"])
+
+        items = second["updated_state"]["chat_context"]["items"]
+        assert [item["content"] for item in items] == [
+            ["hello"],
+            ["Echo: hello"],
+            ["again"],
+            ["Echo: again"],
+        ]
+
+
+class TestExecuteStream:
+    """Test the server-sent events variant of /execute."""
+
+    def test_stream_sends_chunks_then_final_state(self, tmp_path):
+        """Test that reply chunks arrive before a done event with the updated state."""
+        agent_file = tmp_path / "stream_agent.py"
+        agent_file.write_text(AGENT_SOURCE)
+
+        with TestClient(create_app(agent_file=str(agent_file))) as client:
+            response = client.post(
+                "/execute/stream",
+                json={
+                    "request_id": "req-1",
+                    "session_id": "session-1",
+                    "user_id": "user-1",
+                    "message": "hello",
+                },
+            )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        events = response.text.strip().split("\n\n")
+        assert events[0] == 'data: "Echo: hello"'
+
+        event_line, data_line = events[-1].split("\n")
+        assert event_line == "event: done"
+        done = json.loads(data_line.removeprefix("data: "))
+        assert done["status"] == "success"
+        assert done["response"] == "Echo: hello"
+        assert len(done["updated_state"]["chat_context"]["items"]) == 2
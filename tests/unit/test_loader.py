@@ -0,0 +1,52 @@
+"""
+Unit tests for agent file loading.
+"""
+
+import os
+
+from livetxt.loader import load_agent_from_file, load_module_from_file
+
+AGENT_SOURCE = '''
+from livekit.agents import Agent
+
+
+class {name}(Agent):
+    def __init__(self) -> None:
+        super().__init__(instructions="You are a test agent.")
+'''
+
+
+class TestLoadAgentCache:
+    """Test memoization of loaded agent classes."""
+
+    def test_unchanged_file_not_reloaded(self, tmp_path):
+        """Test that loading the same file twice returns the cached class."""
+        agent_file = tmp_path / "cached_agent.py"
+        agent_file.write_text(AGENT_SOURCE.format(name="CachedAgent"))
+
+        first = load_agent_from_file(agent_file)
+        second = load_agent_from_file(str(agent_file))
+
+        assert first is second
+
+    def test_edited_file_reloaded(self, tmp_path):
+        """Test that a newer mtime invalidates the cached class."""
+        agent_file = tmp_path / "edited_agent.py"
+        agent_file.write_text(AGENT_SOURCE.format(name="OldAgent"))
+        assert load_agent_from_file(agent_file).__name__ == "OldAgent"
+
+        agent_file.write_text(AGENT_SOURCE.format(name="NewAgent"))
+        stat = agent_file.stat()
+        os.utime(agent_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_agent_from_file(agent_file).__name__ == "NewAgent"
+
+    def test_module_executed_once(self, tmp_path):
+        """Test that load_module_from_file reuses the executed module."""
+        module_file = tmp_path / "cached_module.py"
+        module_file.write_text("SENTINEL = object()\n")
+
+        first = load_module_from_file(module_file)
+        second = load_module_from_file(module_file)
+
+        assert first is second
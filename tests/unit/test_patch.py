@@ -0,0 +1,46 @@
+"""
+Unit tests for the LiveKit compatibility patches.
+"""
+
+from livekit.agents import Agent
+from livekit.agents.llm import function_tool, utils
+
+from livetxt.shim.patch import patch_tool_schema_cache
+
+
+class ToolAgent(Agent):
+    def __init__(self) -> None:
+        super().__init__(instructions="You are a test agent.")
+
+    @function_tool
+    async def lookup(self, query: str) -> str:
+        """
+        Look something up.
+
+        Args:
+            query: What to look up
+        """
+        return query
+
+
+class TestToolSchemaCache:
+    """Test memoization of function tool argument models."""
+
+    def test_model_reused_across_instances(self):
+        """Test that the argument model is built once per tool function."""
+        patch_tool_schema_cache()
+
+        first = utils.function_arguments_to_pydantic_model(ToolAgent().lookup)
+        second = utils.function_arguments_to_pydantic_model(ToolAgent().lookup)
+
+        assert first is second
+        assert list(first.model_fields) == ["query"]
+
+    def test_schema_still_built(self):
+        """Test that strict schemas are still generated from the cached model."""
+        patch_tool_schema_cache()
+
+        schema = utils.build_strict_openai_schema(ToolAgent().lookup)
+
+        assert schema["function"]["name"] == "lookup"
+        assert "query" in schema["function"]["parameters"]["properties"]
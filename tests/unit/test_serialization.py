@@ -15,6 +15,7 @@ from livetxt.serialization import (
     serialize_chat_context,
     serialize_function_tool_call,
     serialize_session_state,
+    trim_chat_context,
 )
 
 
@@ -248,3 +249,35 @@ class TestRoundTripIntegration:
         assert restored.messages[1].tool_calls[0].arguments["expression"] == "15 * 7"
         assert restored.messages[4].content == "Now divide that by 5"
         assert restored.messages[8].content == "105 / 5 equals 21."
+
+
+class TestSlidingWindow:
+    """Test trimming restored history to the last N turns."""
+
+    @staticmethod
+    def _conversation(turns: int) -> llm.ChatContext:
+        ctx = llm.ChatContext()
+        ctx.add_message(role="system", content="You are helpful.")
+        for i in range(turns):
+            ctx.add_message(role="user", content=f"question {i}")
+            ctx.add_message(role="assistant", content=f"answer {i}")
+        return ctx
+
+    def test_keeps_last_turns_and_instructions(self):
+        """Older turns are dropped, the system prompt survives."""
+        ctx = trim_chat_context(self._conversation(5), max_turns=2)
+
+        assert [item.role for item in ctx.items] == ["system", "user", "assistant", "user", "assistant"]
+        assert ctx.items[1].text_content == "question 3"
+
+    def test_short_history_untouched(self):
+        """Conversations within the window are left as-is."""
+        ctx = trim_chat_context(self._conversation(2), max_turns=2)
+        assert len(ctx.items) == 5
+
+    def test_session_state_applies_window(self):
+        """deserialize_session_state trims, unless max_turns is None."""
+        data = {"chat_context": serialize_chat_context(self._conversation(3))}
+
+        assert len(deserialize_session_state(data, max_turns=1)["chat_context"].items) == 3
+        assert len(deserialize_session_state(data, max_turns=None)["chat_context"].items) == 7